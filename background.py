@@ -0,0 +1,91 @@
+import pygame
+
+# --- Parallax Layers ---
+# (share of the stars, radius range, scroll speed in pixels per second), far to near
+PARALLAX_LAYERS = [
+    (0.7, (1, 2), 8.0),
+    (0.3, (2, 3), 24.0),
+]
+
+class Starfield:
+    """
+    Stars rendered once into a surface, so drawing them is a single blit
+    however many there are.
+
+    With a background color the surface is opaque and replaces filling the
+    screen; with background=None the empty pixels are a color key and the
+    field can be laid over another one. A tiling starfield is rendered twice
+    side by side, with stars that cross the seam drawn on both sides, so a
+    horizontal scroll is one blit of a screen-sized area at an offset.
+    """
+    def __init__(self, size, star_count, rng, color=(255, 255, 255), background=(0, 0, 0),
+                 radius_range=(2, 4), tiling=False):
+        width, height = size
+        self.size = size
+        self.tiling = tiling
+        self.offset = 0.0
+        self.speed = 0.0 # Pixels per second the field scrolls left, for tiling fields
+        surface_width = width * 2 if tiling else width
+        display = pygame.display.get_surface()
+        if display is not None:
+            # Made in the display's pixel format, so blits need no conversion and no converted copy is made
+            self.surface = pygame.Surface((surface_width, height), 0, display)
+        else:
+            self.surface = pygame.Surface((surface_width, height))
+        key = (0, 0, 0) if background is None else background
+        self.surface.fill(key)
+        copies = [-width, 0, width, 2 * width] if tiling else [0]
+        for _ in range(star_count):
+            star_x = rng.randint(0, width)
+            star_y = rng.randint(0, height)
+            star_size = rng.randint(*radius_range)
+            for shift in copies:
+                pygame.draw.circle(self.surface, color, (star_x + shift, star_y), star_size)
+        if background is None:
+            # Stars are sparse, so a run-length encoded color key blits only their pixels
+            self.surface.set_colorkey(key, pygame.RLEACCEL)
+
+    def update(self, seconds):
+        if self.tiling:
+            self.offset = (self.offset + self.speed * seconds) % self.size[0]
+
+    def draw(self, surface):
+        if self.tiling:
+            area = pygame.Rect(int(self.offset), 0, self.size[0], self.size[1])
+            return surface.blit(self.surface, (0, 0), area)
+        return surface.blit(self.surface, (0, 0))
+
+class ParallaxBackground:
+    """
+    Starfield layers scrolling at different speeds, the nearer ones faster.
+
+    Every layer is a tiling Starfield rendered once, so a frame costs one
+    blit per layer (two with the default PARALLAX_LAYERS) and nothing per
+    star. The farthest layer is opaque and replaces filling the screen.
+    """
+    def __init__(self, size, star_count, rng, color=(255, 255, 255), background=(0, 0, 0),
+                 layers=PARALLAX_LAYERS):
+        self.layers = []
+        for index, (share, radius_range, speed) in enumerate(layers):
+            layer = Starfield(size, round(star_count * share), rng, color, background if index == 0 else None,
+                              radius_range, tiling=True)
+            layer.speed = speed
+            self.layers.append(layer)
+
+    def update(self, seconds):
+        for layer in self.layers:
+            layer.update(seconds)
+
+    def draw(self, surface):
+        rects = [layer.draw(surface) for layer in self.layers]
+        return rects[0].unionall(rects[1:])
+
+def make_background(kind, size, star_count, rng):
+    # The playing background for a PLAYING_BACKGROUND option value
+    if kind is None:
+        return None
+    if kind == "static":
+        return Starfield(size, star_count, rng)
+    if kind == "parallax":
+        return ParallaxBackground(size, star_count, rng)
+    raise ValueError(f"unknown background {kind!r}; use 'static', 'parallax' or None")
@@ -0,0 +1,231 @@
+try:
+    import numpy as np
+except ImportError: # NumPy is only needed for batched simulation
+    np = None
+
+from simulation import (COLORS, DIFFICULTY_PRESETS, FIELD_HEIGHT, FIELD_WIDTH, HIT_SCORE, COMBO_STEP, LIVES_COUNT,
+                        ORB_SIZE, PROJECTILE_SIZE, PROJECTILE_SPEED, ring_radius)
+
+# --- Session States ---
+PLAYING = 0
+WIN = 1
+GAME_OVER = 2
+
+class BatchEnv:
+    """
+    Many independent Orbital Match sessions stepped together in NumPy arrays.
+
+    Every session plays one difficulty with the rules of simulation.Game and
+    the "rects" collision test, but all orbs, projectiles, lives, scores and
+    combos are held as (batch_size, ...) arrays and advanced with one
+    vectorized step() for the whole batch. Colors are indices into COLORS.
+
+    Each session has max_projectiles slots for shots in flight; a fire flag is
+    ignored while all of them are taken. Finished sessions stay frozen (done)
+    until reset() is called for them.
+    """
+    def __init__(self, batch_size, difficulty="easy", max_projectiles=8, width=FIELD_WIDTH, height=FIELD_HEIGHT,
+                 next_color_weighted=False, lives_count=LIVES_COUNT, projectile_speed=PROJECTILE_SPEED, seed=None):
+        if np is None:
+            raise RuntimeError("BatchEnv needs NumPy (pip install numpy)")
+        preset = DIFFICULTY_PRESETS[difficulty]
+        self.batch_size = batch_size
+        self.difficulty = difficulty
+        self.speed_modifier = preset["speed_modifier"]
+        self.orb_count = preset["orb_count"]
+        self.available_colors = preset["available_colors"]
+        self.max_projectiles = max_projectiles
+        self.width = width
+        self.height = height
+        self.center_x = width // 2
+        self.center_y = height // 2
+        self.next_color_weighted = next_color_weighted
+        self.lives_count = lives_count
+        self.projectile_speed = projectile_speed
+        self.rng = np.random.default_rng(seed)
+        # Rects of these sizes overlap while their centers are closer than this on both axes
+        self.hit_reach = (ORB_SIZE + PROJECTILE_SIZE) // 2
+        self.projectile_half = PROJECTILE_SIZE // 2
+
+        # Same layout as Game.setup_level; only colors and speeds differ per session
+        shape = (batch_size, self.orb_count)
+        self.orb_radius = np.broadcast_to(
+            np.array([ring_radius(i) for i in range(self.orb_count)], dtype=np.float64), shape)
+        self.orb_start_angle = np.broadcast_to(
+            np.arange(self.orb_count, dtype=np.float64) / self.orb_count * 2 * np.pi, shape)
+        self.orb_angle = np.zeros(shape)
+        self.orb_speed = np.zeros(shape)
+        self.orb_color = np.zeros(shape, dtype=np.int8)
+        self.orb_alive = np.zeros(shape, dtype=bool)
+
+        slots = (batch_size, max_projectiles)
+        self.projectile_x = np.zeros(slots)
+        self.projectile_y = np.zeros(slots)
+        self.projectile_velocity_x = np.zeros(slots)
+        self.projectile_velocity_y = np.zeros(slots)
+        self.projectile_color = np.zeros(slots, dtype=np.int8)
+        self.projectile_active = np.zeros(slots, dtype=bool)
+        # Order the shots were fired in, which is the order Game resolves their collisions
+        self.projectile_order = np.zeros(slots, dtype=np.int64)
+        self.shots_fired = 0
+
+        self.state = np.zeros(batch_size, dtype=np.int8)
+        self.score = np.zeros(batch_size, dtype=np.int64)
+        self.lives = np.zeros(batch_size, dtype=np.int64)
+        self.combo_count = np.zeros(batch_size, dtype=np.int64)
+        self.next_color = np.zeros(batch_size, dtype=np.int8)
+        self.ticks = np.zeros(batch_size, dtype=np.int64)
+        self.sessions = np.arange(batch_size)
+        self.reset()
+
+    def reset(self, sessions=None):
+        # Start new games in the given sessions (a bool mask or indices), or in all of them
+        if sessions is None:
+            sessions = self.sessions
+        elif getattr(sessions, "dtype", None) == bool:
+            sessions = np.flatnonzero(sessions)
+        count = len(sessions)
+        shape = (count, self.orb_count)
+        self.orb_color[sessions] = self.rng.integers(0, self.available_colors, shape)
+        self.orb_angle[sessions] = self.orb_start_angle[sessions]
+        self.orb_speed[sessions] = 0.005 + self.rng.uniform(-0.001, 0.001, shape)
+        self.orb_alive[sessions] = True
+        self.projectile_active[sessions] = False
+        self.state[sessions] = PLAYING
+        self.score[sessions] = 0
+        self.lives[sessions] = self.lives_count
+        self.combo_count[sessions] = 0
+        self.ticks[sessions] = 0
+        # The first color is weighted by how many orbs of each color there are
+        self.next_color[sessions] = self._random_color(sessions, weighted=True)
+        return self.observation()
+
+    def _color_counts(self, sessions):
+        # (sessions, colors) count of live orbs of each color
+        colors = self.orb_color[sessions]
+        alive = self.orb_alive[sessions]
+        return np.stack([((colors == index) & alive).sum(axis=1) for index in range(len(COLORS))], axis=1)
+
+    def _random_color(self, sessions, weighted):
+        # Like ColorRegistry.random_color, for many sessions at once; -1 once every orb is gone
+        counts = self._color_counts(sessions)
+        weights = counts if weighted else (counts > 0).astype(np.int64)
+        totals = weights.sum(axis=1)
+        picks = np.floor(self.rng.random(len(sessions)) * totals)
+        chosen = (np.cumsum(weights, axis=1) > picks[:, None]).argmax(axis=1)
+        return np.where(totals > 0, chosen, -1)
+
+    def _round(self, values):
+        # Rect rounds float coordinates half away from zero; do the same here
+        return np.trunc(values + np.copysign(0.5, values))
+
+    def _fire(self, aim_angles, fire):
+        free = ~self.projectile_active
+        can_fire = fire & (self.state == PLAYING) & self.orb_alive.any(axis=1) & free.any(axis=1)
+        sessions = np.flatnonzero(can_fire)
+        if not len(sessions):
+            return
+        slots = free[sessions].argmax(axis=1)
+        angles = aim_angles[sessions]
+        self.projectile_x[sessions, slots] = self.center_x
+        self.projectile_y[sessions, slots] = self.center_y
+        self.projectile_velocity_x[sessions, slots] = self.projectile_speed * np.cos(angles)
+        self.projectile_velocity_y[sessions, slots] = self.projectile_speed * np.sin(angles)
+        self.projectile_color[sessions, slots] = self.next_color[sessions]
+        self.projectile_active[sessions, slots] = True
+        self.projectile_order[sessions, slots] = self.shots_fired
+        self.shots_fired += 1
+        self.next_color[sessions] = self._random_color(sessions, self.next_color_weighted)
+
+    def _resolve(self, sessions, slots, orbs):
+        # One projectile meeting one orb in each of the given sessions, as in Game.step
+        matched = self.projectile_color[sessions, slots] == self.orb_color[sessions, orbs]
+        hits = sessions[matched]
+        self.combo_count[hits] += 1
+        self.score[hits] += HIT_SCORE * (1 + self.combo_count[hits] // COMBO_STEP)
+        self.orb_alive[hits, orbs[matched]] = False
+        wrong = sessions[~matched]
+        self.lives[wrong] -= 1
+        self.combo_count[wrong] = 0
+        self.projectile_active[sessions, slots] = False
+        if len(hits):
+            self.next_color[hits] = self._random_color(hits, self.next_color_weighted)
+
+    def step(self, aim_angles, fire):
+        # Fire where asked, then advance every running session by one tick.
+        # Returns (observation, reward, done): reward is the score gained this tick.
+        aim_angles = np.asarray(aim_angles, dtype=np.float64)
+        fire = np.asarray(fire, dtype=bool)
+        self._fire(aim_angles, fire)
+        playing = self.state == PLAYING
+        score_before = self.score.copy()
+
+        # --- Movement ---
+        moving = playing[:, None]
+        self.orb_angle += np.where(moving, self.orb_speed * self.speed_modifier, 0.0)
+        flying = self.projectile_active & moving
+        self.projectile_x += np.where(flying, self.projectile_velocity_x, 0.0)
+        self.projectile_y += np.where(flying, self.projectile_velocity_y, 0.0)
+        self.ticks += playing
+
+        # --- Projectiles that left the field ---
+        projectile_cx = self._round(self.projectile_x)
+        projectile_cy = self._round(self.projectile_y)
+        half = self.projectile_half
+        off_field = flying & ((projectile_cx - half > self.width) | (projectile_cx + half < 0) |
+                              (projectile_cy - half > self.height) | (projectile_cy + half < 0))
+        misses = off_field.sum(axis=1)
+        self.lives -= misses
+        self.combo_count[misses > 0] = 0
+        self.projectile_active &= ~off_field
+
+        # --- Collisions ---
+        # Only shots in flight are tested, each against the orbs of its own session
+        pair_sessions, pair_slots = np.nonzero(flying & ~off_field)
+        if len(pair_sessions):
+            sessions, rows = np.unique(pair_sessions, return_inverse=True)
+            angles = self.orb_angle[sessions]
+            radii = self.orb_radius[sessions]
+            orb_cx = self._round(self.center_x + radii * np.cos(angles))[rows]
+            orb_cy = self._round(self.center_y + radii * np.sin(angles))[rows]
+            touching = ((np.abs(projectile_cx[pair_sessions, pair_slots][:, None] - orb_cx) < self.hit_reach) &
+                        (np.abs(projectile_cy[pair_sessions, pair_slots][:, None] - orb_cy) < self.hit_reach) &
+                        self.orb_alive[pair_sessions])
+            pair_contacts = touching.sum(axis=1)
+            contacts = np.bincount(pair_sessions, pair_contacts, self.batch_size)
+            # Almost always one projectile touches one orb; those are resolved all at once
+            single = np.flatnonzero((pair_contacts == 1) & (contacts[pair_sessions] == 1))
+            if len(single):
+                self._resolve(pair_sessions[single], pair_slots[single], touching[single].argmax(axis=1))
+            # Several contacts in a session are resolved one by one, in the order Game uses
+            for session in np.flatnonzero(contacts > 1).tolist():
+                pairs = np.flatnonzero((pair_sessions == session) & (pair_contacts > 0))
+                pairs = pairs[np.argsort(self.projectile_order[session, pair_slots[pairs]])]
+                for pair in pairs.tolist():
+                    for orb in np.flatnonzero(touching[pair]).tolist():
+                        self._resolve(np.array([session]), pair_slots[pair:pair + 1], np.array([orb]))
+
+        # --- Win / Game Over ---
+        cleared = playing & ~self.orb_alive.any(axis=1)
+        self.state[cleared] = WIN
+        self.state[playing & (self.lives <= 0)] = GAME_OVER
+        return self.observation(), self.score - score_before, self.state != PLAYING
+
+    def observation(self):
+        # Views of the live arrays; copy them to keep a snapshot
+        return {
+            "orb_angle": self.orb_angle,
+            "orb_radius": self.orb_radius,
+            "orb_color": self.orb_color,
+            "orb_alive": self.orb_alive,
+            "projectile_x": self.projectile_x,
+            "projectile_y": self.projectile_y,
+            "projectile_color": self.projectile_color,
+            "projectile_active": self.projectile_active,
+            "next_color": self.next_color,
+            "lives": self.lives,
+            "score": self.score,
+            "combo_count": self.combo_count,
+            "state": self.state,
+            "ticks": self.ticks,
+        }
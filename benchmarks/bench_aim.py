@@ -0,0 +1,68 @@
+"""
+Hit rate against a stationary target as a function of aim angle.
+
+A target the size of an orb is placed 300 px from the launcher along each
+aim angle and one projectile is fired straight at it. The old integer rect
+stepping (rect.x += velocity_x) is compared with the float positions in
+Projectile.update at several projectile speeds. With float positions every
+octant must hit 100% of the time at every speed; if one does not, the script
+exits with an error, so it can run as a check.
+
+    python benchmarks/bench_aim.py [angles]
+"""
+import os
+import sys
+import math
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+import orbital_match as game
+
+SPEEDS = [0.4, 1, 5, 15]
+TARGET_DISTANCE = 300
+OCTANTS = 8
+
+class IntegerProjectile(game.Projectile):
+    # The projectile motion before float positions: velocity added to the int rect
+    def update(self):
+        self.rect.x += self.velocity_x
+        self.rect.y += self.velocity_y
+
+def fire(projectile_class, angle, speed):
+    center_x, center_y = game.SCREEN_WIDTH // 2, game.SCREEN_HEIGHT // 2
+    target = pygame.Rect(0, 0, 30, 30)
+    target.center = (center_x + TARGET_DISTANCE * math.cos(angle), center_y + TARGET_DISTANCE * math.sin(angle))
+    projectile = projectile_class(center_x, center_y, game.RED, angle, speed)
+    # Enough ticks to fly well past the target
+    for _ in range(int(2 * TARGET_DISTANCE / speed)):
+        projectile.update()
+        if projectile.rect.colliderect(target):
+            return True
+    return False
+
+def main():
+    angle_count = int(sys.argv[1]) if len(sys.argv) > 1 else 720
+    angles = [i * 2 * math.pi / angle_count for i in range(angle_count)]
+    print(f"{'speed':>6} {'motion':>8} {'overall':>8}  hit rate per octant")
+    misses = []
+    for speed in SPEEDS:
+        for label, projectile_class in (("integer", IntegerProjectile), ("float", game.Projectile)):
+            octant_hits = [0] * OCTANTS
+            for angle in angles:
+                if fire(projectile_class, angle, speed):
+                    octant_hits[int(angle / (2 * math.pi) * OCTANTS)] += 1
+            per_octant = angle_count / OCTANTS
+            rates = " ".join(f"{hits / per_octant:>4.0%}" for hits in octant_hits)
+            print(f"{speed:>6} {label:>8} {sum(octant_hits) / angle_count:>8.0%}  {rates}")
+            if projectile_class is game.Projectile:
+                misses.extend((speed, octant) for octant, hits in enumerate(octant_hits) if hits < per_octant)
+    if misses:
+        raise SystemExit("float motion missed the target in " +
+                         ", ".join(f"octant {octant} at speed {speed}" for speed, octant in misses))
+    print("float motion hit the target at every angle and speed")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Per-frame cost of the starfield backgrounds against drawing the stars.
+
+For 150, 5k and 50k stars, compares drawing every star as a circle each
+frame (what the menus used to do) with a cached Starfield (one blit) and a
+two-layer ParallaxBackground (one blit per layer, scrolled by offset), plus
+the one-off cost of rendering each. A plain screen fill is the baseline a
+background replaces. Runs headless with the SDL dummy drivers.
+
+    python benchmarks/bench_background.py [frames]
+"""
+import os
+import sys
+import time
+import random
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+import orbital_match as game
+from background import ParallaxBackground, Starfield
+
+STAR_COUNTS = [150, 5000, 50000]
+FRAME_BUDGET_MS = 1000 / game.FPS
+SIZE = (game.SCREEN_WIDTH, game.SCREEN_HEIGHT)
+
+def time_frames(draw, frames):
+    draw() # Warm up
+    start = time.perf_counter()
+    for _ in range(frames):
+        draw()
+    return (time.perf_counter() - start) * 1000 / frames
+
+def time_build(build):
+    start = time.perf_counter()
+    result = build()
+    return result, (time.perf_counter() - start) * 1000
+
+def main():
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else 120
+    screen = game.screen
+    fill_ms = time_frames(lambda: screen.fill(game.BLACK), frames)
+    print(f"screen fill: {fill_ms:.3f} ms per frame")
+    print(f"{'stars':>6} {'circles ms':>11} {'static ms':>10} {'parallax ms':>12} {'static build ms':>16} "
+          f"{'parallax build ms':>18}")
+    for count in STAR_COUNTS:
+        rng = random.Random(0)
+        stars = [(rng.randint(0, SIZE[0]), rng.randint(0, SIZE[1]), rng.randint(2, 4)) for _ in range(count)]
+
+        def draw_circles():
+            screen.fill(game.BLACK)
+            for star_x, star_y, star_size in stars:
+                pygame.draw.circle(screen, game.WHITE, (star_x, star_y), star_size)
+
+        static, static_build_ms = time_build(lambda: Starfield(SIZE, count, random.Random(0)))
+        parallax, parallax_build_ms = time_build(lambda: ParallaxBackground(SIZE, count, random.Random(0)))
+
+        def draw_parallax():
+            parallax.update(1 / game.FPS)
+            parallax.draw(screen)
+
+        circles_ms = time_frames(draw_circles, max(1, frames * 150 // count))
+        static_ms = time_frames(lambda: static.draw(screen), frames)
+        parallax_ms = time_frames(draw_parallax, frames)
+        print(f"{count:>6} {circles_ms:>11.3f} {static_ms:>10.3f} {parallax_ms:>12.3f} {static_build_ms:>16.1f} "
+              f"{parallax_build_ms:>18.1f}")
+    print(f"frame budget at {game.FPS} FPS: {FRAME_BUDGET_MS:.1f} ms")
+    pygame.quit()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+Game-steps per second of BatchEnv as the batch grows.
+
+Every session aims at random and fires one tick in ten; finished sessions
+are reset so the whole batch keeps playing. One simulation.Game stepped in
+a Python loop with the same policy is the baseline.
+
+    python benchmarks/bench_batch_env.py [ticks]
+"""
+import os
+import sys
+import time
+import math
+import random
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+from batch_env import BatchEnv
+from simulation import Game
+
+BATCH_SIZES = [1, 16, 256, 1024, 4096]
+DIFFICULTY = "hard"
+FIRE_CHANCE = 0.1
+
+def game_steps_per_second(ticks):
+    rng = random.Random(0)
+    game = Game(seed=0)
+    game.setup_level(DIFFICULTY)
+    start = time.perf_counter()
+    for _ in range(ticks):
+        if rng.random() < FIRE_CHANCE:
+            game.fire(rng.uniform(0, 2 * math.pi))
+        game.step()
+        if game.state != "playing":
+            game.setup_level(DIFFICULTY)
+    return ticks / (time.perf_counter() - start)
+
+def batch_steps_per_second(batch_size, ticks):
+    env = BatchEnv(batch_size, DIFFICULTY, seed=0)
+    rng = np.random.default_rng(1)
+    start = time.perf_counter()
+    for _ in range(ticks):
+        aim_angles = rng.uniform(0, 2 * np.pi, batch_size)
+        fire = rng.random(batch_size) < FIRE_CHANCE
+        _, _, done = env.step(aim_angles, fire)
+        if done.any():
+            env.reset(done)
+    return batch_size * ticks / (time.perf_counter() - start)
+
+def main():
+    ticks = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    baseline = game_steps_per_second(ticks * 10)
+    print(f"Game loop: {baseline:,.0f} game-steps/s")
+    print(f"{'batch':>6} {'game-steps/s':>14} {'vs Game':>8}")
+    for batch_size in BATCH_SIZES:
+        rate = batch_steps_per_second(batch_size, ticks)
+        print(f"{batch_size:>6} {rate:>14,.0f} {rate / baseline:>7.1f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+Cost of pygame.sprite.groupcollide versus RingCollider as the orb count grows.
+
+Runs the way Game.step does: the orbs move a tick at Neptune speed, then
+each backend tests the projectiles against them, and only the collision
+test is timed. The ring collider keeps its buckets between ticks and moves
+the orbs that change sector. Projectiles are spread over every direction
+and distance from the launcher. Each row also checks that both backends
+returned the same collision dict on every tick.
+
+    python benchmarks/bench_collision.py [projectiles]
+"""
+import os
+import sys
+import time
+import math
+import random
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+import orbital_match as game
+from collision import RingCollider
+from layouts import make_orbs
+
+ORB_COUNTS = [40, 400, 4000, 40000]
+TICKS = 60
+SPEED_MODIFIER = 3.0 # Neptune
+CENTER = (game.SCREEN_WIDTH // 2, game.SCREEN_HEIGHT // 2)
+
+def make_projectiles(count):
+    random.seed(1)
+    projectiles = pygame.sprite.Group()
+    for _ in range(count):
+        angle = random.uniform(0, 2 * math.pi)
+        distance = random.uniform(0, 350)
+        x = CENTER[0] + distance * math.cos(angle)
+        y = CENTER[1] + distance * math.sin(angle)
+        projectiles.add(game.Projectile(x, y, game.RED, angle))
+    return projectiles
+
+def main():
+    projectile_count = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    projectiles = make_projectiles(projectile_count)
+    print(f"{projectile_count} projectiles, {TICKS} ticks")
+    print(f"{'orbs':>6} {'groupcollide ms':>16} {'ring ms':>8} {'same':>5}")
+    for count in ORB_COUNTS:
+        orbs = make_orbs(count, CENTER, game.Orb, random_angles=True)
+        orbs.update(SPEED_MODIFIER)
+        collider = RingCollider(CENTER, SPEED_MODIFIER)
+        collider.groupcollide(projectiles, orbs, False, False) # Builds the buckets, as the first tick of a level does
+        brute_seconds = ring_seconds = 0.0
+        same = True
+        for _ in range(TICKS):
+            orbs.update(SPEED_MODIFIER)
+            start = time.perf_counter()
+            expected = pygame.sprite.groupcollide(projectiles, orbs, False, False)
+            middle = time.perf_counter()
+            result = collider.groupcollide(projectiles, orbs, False, False)
+            brute_seconds += middle - start
+            ring_seconds += time.perf_counter() - middle
+            same = same and result == expected
+        print(f"{count:>6} {brute_seconds * 1000 / TICKS:>16.3f} {ring_seconds * 1000 / TICKS:>8.3f} {str(same):>5}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+CPU used by an idle title screen: the old busy-wait loop against run_screen().
+
+Each variant shows the title screen for the same time with no input, then a
+timer posts a click on the Earth button. The busy loop polls event.get() as
+fast as it can, like the menus used to; run_screen() blocks in event.wait.
+Runs headless with the SDL dummy drivers, where the event loop is the only
+work left, so the busy loop shows up as close to a full core.
+
+    python benchmarks/bench_menu_idle.py [seconds]
+"""
+import os
+import sys
+import random
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+import orbital_match as game
+from menu import CpuMeter, run_screen
+
+def click_earth_after(seconds):
+    earth_center = (game.SCREEN_WIDTH // 2, game.SCREEN_HEIGHT // 2 + 30)
+    click = pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=earth_center, button=1)
+    pygame.time.set_timer(click, int(seconds * 1000), 1)
+
+def busy_wait(title, meter):
+    # The loop the menus had before: draw once, then poll without sleeping
+    title.draw(game.screen)
+    pygame.display.flip()
+    meter.redraws += 1
+    while not title.closed:
+        for event in pygame.event.get():
+            title.handle_event(event)
+    return title.result
+
+def measure(name, show, seconds):
+    pygame.event.clear()
+    starfield = game.Starfield((game.SCREEN_WIDTH, game.SCREEN_HEIGHT), game.STARFIELD_STARS, random.Random(0))
+    title = game.TitleScreen(starfield)
+    click_earth_after(seconds)
+    meter = CpuMeter()
+    meter.start()
+    result = show(title, meter)
+    meter.stop()
+    wall_seconds, cpu_seconds = meter.totals()
+    print(f"{name:>12} {wall_seconds:>8.2f} {cpu_seconds:>8.2f} {100 * cpu_seconds / wall_seconds:>9.1f}% "
+          f"{meter.redraws:>8} {result:>7}")
+
+def main():
+    seconds = float(sys.argv[1]) if len(sys.argv) > 1 else 3.0
+    print(f"{'loop':>12} {'wall s':>8} {'cpu s':>8} {'cpu':>10} {'redraws':>8} {'result':>7}")
+    measure("busy wait", busy_wait, seconds)
+    measure("run_screen", lambda title, meter: run_screen(title, game.screen, meter), seconds)
+    pygame.quit()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+Per-step cost of Orb.update through a sprite Group versus the NumPy OrbEngine.
+
+The engine's step is timed on its own and its write-back of the rects, which
+the game does once per drawn frame, separately; a frame with one tick costs
+both. Also checks that both produce the same rect positions, and that the
+engine's groupcollide finds the same hits as pygame's on those rects.
+
+    python benchmarks/bench_orb_engine.py [steps]
+"""
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+import orbital_match as game
+from layouts import make_orbs
+from orb_engine import OrbEngine
+
+ORB_COUNTS = [40, 1000, 10000, 100000]
+FRAME_BUDGET_MS = 1000 / game.FPS
+SPEED_MODIFIER = 3.0 # Neptune
+CENTER = (game.SCREEN_WIDTH // 2, game.SCREEN_HEIGHT // 2)
+
+def make_projectiles(orbs):
+    # One projectile on every tenth orb (up to 50), so there are hits to compare
+    projectiles = pygame.sprite.Group()
+    for orb in orbs.sprites()[:500:10]:
+        projectiles.add(game.Projectile(orb.rect.centerx + 5, orb.rect.centery, game.COLORS[0], 0.0))
+    return projectiles
+
+def main():
+    steps = int(sys.argv[1]) if len(sys.argv) > 1 else 60
+    print(f"{'orbs':>7} {'sprites ms':>11} {'engine ms':>10} {'speedup':>8} {'write-back ms':>14} {'mismatches':>11}")
+    for count in ORB_COUNTS:
+        sprite_orbs = make_orbs(count, CENTER, game.Orb)
+        start = time.perf_counter()
+        for _ in range(steps):
+            sprite_orbs.update(SPEED_MODIFIER)
+        sprite_ms = (time.perf_counter() - start) * 1000 / steps
+
+        engine_orbs = make_orbs(count, CENTER, game.Orb)
+        engine = OrbEngine(engine_orbs, CENTER, game.COLORS)
+        start = time.perf_counter()
+        for _ in range(steps):
+            engine.update(engine_orbs, SPEED_MODIFIER)
+        engine_ms = (time.perf_counter() - start) * 1000 / steps
+
+        start = time.perf_counter()
+        engine.write_back()
+        write_back_ms = (time.perf_counter() - start) * 1000
+
+        mismatches = sum(a.rect != b.rect for a, b in zip(sprite_orbs, engine_orbs))
+        projectiles = make_projectiles(engine_orbs)
+        if engine.groupcollide(projectiles, engine_orbs, False, False) != \
+                pygame.sprite.groupcollide(projectiles, engine_orbs, False, False):
+            mismatches += 1
+        print(f"{count:>7} {sprite_ms:>11.3f} {engine_ms:>10.3f} {sprite_ms / engine_ms:>7.1f}x {write_back_ms:>14.3f} "
+              f"{mismatches:>11}")
+    print(f"frame budget at {game.FPS} FPS: {FRAME_BUDGET_MS:.1f} ms")
+
+if __name__ == "__main__":
+    main()
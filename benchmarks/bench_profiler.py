@@ -0,0 +1,70 @@
+"""
+Overhead of the frame profiler on the simulation tick.
+
+Plays the same seeded Neptune games with Game.profiler left as None and with
+a FrameProfiler that marks every phase and closes one frame per tick, the
+heaviest use the game loop makes of it. Both runs must end with the same
+results, and the per-tick difference is reported against the frame budget.
+
+    python benchmarks/bench_profiler.py [games]
+"""
+import os
+import sys
+import time
+import random
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from profiler import FrameProfiler
+from simulation import Game
+from tournament import lead_policy
+
+FRAME_BUDGET_MS = 1000 / 60
+MAX_TICKS = 60 * 60 * 5
+
+def play(seed, profiler):
+    game = Game(seed=seed)
+    game.profiler = profiler
+    game.setup_level("hard")
+    rng = random.Random(seed)
+    while game.state == "playing" and game.ticks < MAX_TICKS:
+        if profiler is not None:
+            profiler.begin_frame()
+        angle = lead_policy(game, rng)
+        if angle is not None:
+            game.fire(angle)
+        if profiler is not None:
+            profiler.mark("logic")
+        game.step()
+        if profiler is not None:
+            profiler.end_frame()
+    return game.state, game.score, game.ticks
+
+def run(games, profiler):
+    start = time.perf_counter()
+    results = [play(seed, profiler) for seed in range(games)]
+    return results, time.perf_counter() - start
+
+def main():
+    games = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    run(5, None) # Warm up
+    baseline, baseline_seconds = run(games, None)
+    profiler = FrameProfiler()
+    profiled, profiled_seconds = run(games, profiler)
+    if profiled != baseline:
+        raise SystemExit("profiling changed the game results")
+
+    ticks = sum(result[2] for result in baseline)
+    baseline_us = baseline_seconds / ticks * 1e6
+    profiled_us = profiled_seconds / ticks * 1e6
+    overhead_us = profiled_us - baseline_us
+    print(f"{'profiler':>9} {'us/tick':>8}")
+    print(f"{'off':>9} {baseline_us:>8.2f}")
+    print(f"{'on':>9} {profiled_us:>8.2f}")
+    print(f"{games} games, {ticks} ticks; profiling adds {overhead_us:.2f} us per tick "
+          f"({overhead_us / 10 / FRAME_BUDGET_MS:.3f}% of a {FRAME_BUDGET_MS:.1f} ms frame)")
+    for phase, stats in profiler.summary().items():
+        print(f"{phase:>10} p50 {stats['p50_ms'] * 1000:7.2f} us  p99 {stats['p99_ms'] * 1000:7.2f} us")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+Frame-time comparison of full-screen and dirty-rectangle rendering.
+
+Runs headless with the SDL dummy drivers. The dummy video driver makes
+display.flip/update nearly free, so the numbers mostly show the saved fill
+and blit work; on a real display the gain from pushing fewer pixels is larger.
+
+    python benchmarks/bench_render.py [frames]
+"""
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+import orbital_match as game
+from dirty_render import DirtyRenderer
+
+# Title screen button for each difficulty preset
+PRESETS = {
+    "Earth": "easy",
+    "Mars": "medium",
+    "Neptune": "hard",
+}
+WINDOW_SIZES = [(1000, 700), (1600, 1000), (2560, 1440)]
+
+def set_up_level(preset):
+    level = game.Game(game.SCREEN_WIDTH, game.SCREEN_HEIGHT, orb_class=game.Orb, projectile_class=game.Projectile,
+                      seed=0)
+    level.setup_level(PRESETS[preset])
+    launcher = game.Launcher()
+    all_sprites = pygame.sprite.RenderUpdates(launcher, level.orbs)
+    return level, launcher, all_sprites
+
+def time_frames(preset, dirty, frames):
+    level, launcher, all_sprites = set_up_level(preset)
+    renderer = DirtyRenderer(game.screen, game.BLACK)
+    start = time.perf_counter()
+    for frame in range(frames):
+        launcher.angle = frame * 0.01
+        level.orbs.update(level.speed_modifier)
+        if dirty:
+            renderer.clear(all_sprites)
+        else:
+            game.screen.fill(game.BLACK)
+        drawn_rects = [launcher.draw(game.screen)]
+        sprite_rects = all_sprites.draw(game.screen)
+        drawn_rects.extend(game.draw_hud(game.screen, 1200, 3, frame % 7, game.RED))
+        if dirty:
+            renderer.present(sprite_rects, drawn_rects)
+        else:
+            pygame.display.flip()
+    return (time.perf_counter() - start) * 1000 / frames
+
+def main():
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else 600
+    print(f"{'window':>11} {'preset':>8} {'full ms':>8} {'dirty ms':>9} {'speedup':>8}")
+    for width, height in WINDOW_SIZES:
+        game.SCREEN_WIDTH, game.SCREEN_HEIGHT = width, height
+        game.screen = pygame.display.set_mode((width, height))
+        for preset in PRESETS:
+            full_ms = time_frames(preset, False, frames)
+            dirty_ms = time_frames(preset, True, frames)
+            print(f"{width:>5}x{height:<5} {preset:>8} {full_ms:>8.3f} {dirty_ms:>9.3f} {full_ms / dirty_ms:>7.1f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+Memory and per-tick cost of the rewind buffer on the Neptune preset.
+
+A bot plays Neptune levels (40 orbs, shots in flight) while every tick is
+recorded into a RewindBuffer holding 30 seconds at 60 ticks per second.
+Reports the cost of record() per tick against the frame budget, the memory
+the full buffer holds, and the average and worst cost of restoring a random
+tick (a keyframe restore plus replaying the ticks after it).
+
+    python benchmarks/bench_rewind.py [ticks]
+"""
+import os
+import sys
+import time
+import random
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from rewind import RewindBuffer
+from simulation import Game
+from tournament import lead_policy
+
+TICK_RATE = 60
+SECONDS = 30
+FRAME_BUDGET_MS = 1000 / TICK_RATE
+KEYFRAME_INTERVALS = [15, 60, 240]
+
+def main():
+    ticks = int(sys.argv[1]) if len(sys.argv) > 1 else 3600
+    print(f"{'keyframe every':>15} {'record us':>10} {'% of frame':>11} {'buffer KB':>10} {'restore us':>11} "
+          f"{'worst us':>10}")
+    for keyframe_interval in KEYFRAME_INTERVALS:
+        game = Game(seed=0)
+        game.setup_level("hard")
+        buffer = RewindBuffer(SECONDS * TICK_RATE, keyframe_interval)
+        policy_rng = random.Random(1)
+        record_seconds = 0.0
+        for _ in range(ticks):
+            if game.state != "playing":
+                game.setup_level("hard")
+            angle = lead_policy(game, policy_rng)
+            if angle is not None and policy_rng.random() < 0.5:
+                game.fire(angle)
+                buffer.fire(angle)
+            game.step()
+            start = time.perf_counter()
+            buffer.record(game)
+            record_seconds += time.perf_counter() - start
+        record_us = record_seconds * 1e6 / ticks
+
+        scratch = Game(seed=2)
+        picks = [random.randrange(len(buffer)) for _ in range(200)]
+        restore_seconds = []
+        for index in picks:
+            start = time.perf_counter()
+            buffer.restore(scratch, index)
+            restore_seconds.append(time.perf_counter() - start)
+        restore_us = sum(restore_seconds) * 1e6 / len(picks)
+        worst_us = max(restore_seconds) * 1e6
+        print(f"{keyframe_interval:>15} {record_us:>10.1f} {record_us / 10 / FRAME_BUDGET_MS:>10.2f}% "
+              f"{buffer.memory_bytes() / 1024:>10.0f} {restore_us:>11.1f} {worst_us:>10.1f}")
+    print(f"{SECONDS} s at {TICK_RATE} ticks/s = {SECONDS * TICK_RATE} ticks held; frame budget {FRAME_BUDGET_MS:.1f} ms")
+
+if __name__ == "__main__":
+    main()
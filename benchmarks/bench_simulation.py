@@ -0,0 +1,61 @@
+"""
+Headless throughput of the simulation core.
+
+Plays whole games with simulation.Game and a simple bot that leads its shots
+at an orb of the next projectile's color, one shot in flight at a time. No
+display, audio device or font is opened; the script checks that at the end.
+
+    python benchmarks/bench_simulation.py [games]
+"""
+import os
+import sys
+import time
+import math
+import random
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+from simulation import Game
+
+DIFFICULTIES = ["easy", "medium", "hard"]
+MAX_TICKS = 60 * 60 * 5 # Give up on a game after five minutes of game time
+
+def aim(game):
+    # Angle that meets an orb of the next color, or None if none is left
+    targets = [orb for orb in game.orbs if orb.color == game.next_projectile_color]
+    if not targets:
+        return None
+    orb = targets[0]
+    flight_ticks = orb.radius / game.projectile_speed
+    angle = orb.angle + orb.speed * game.speed_modifier * flight_ticks
+    return math.atan2(orb.radius * math.sin(angle), orb.radius * math.cos(angle))
+
+def play(difficulty, seed):
+    game = Game(seed=seed)
+    game.setup_level(difficulty)
+    while game.state == "playing" and game.ticks < MAX_TICKS:
+        if not game.projectiles:
+            angle = aim(game)
+            if angle is not None:
+                game.fire(angle)
+        game.step()
+    return game
+
+def main():
+    games = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    rng = random.Random(0)
+    print(f"{'difficulty':>10} {'games/s':>8} {'ticks/s':>9} {'won':>5} {'avg score':>10}")
+    for difficulty in DIFFICULTIES:
+        start = time.perf_counter()
+        results = [play(difficulty, rng.getrandbits(32)) for _ in range(games)]
+        seconds = time.perf_counter() - start
+        ticks = sum(game.ticks for game in results)
+        won = sum(game.state == "win" for game in results)
+        score = sum(game.score for game in results) / games
+        print(f"{difficulty:>10} {games / seconds:>8.0f} {ticks / seconds:>9.0f} {won / games:>5.0%} {score:>10.0f}")
+    print(f"display initialized: {pygame.display.get_init()}, mixer initialized: {bool(pygame.mixer.get_init())}, "
+          f"fonts initialized: {pygame.font.get_init()}")
+
+if __name__ == "__main__":
+    main()
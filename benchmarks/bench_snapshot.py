@@ -0,0 +1,67 @@
+"""
+Size and round-trip time of game snapshots as the orb count grows.
+
+Levels are the Neptune preset with extra orbs dealt onto the same three
+rings and a few shots in flight, with plain Orb sprites and with the NumPy
+orb engine. Each round trip is checked by restoring into a second Game and
+comparing the two after more ticks.
+
+    python benchmarks/bench_snapshot.py [repeats]
+"""
+import os
+import sys
+import time
+import math
+import random
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from simulation import COLORS, Game, Orb, ring_radius
+from snapshot import restore_snapshot, take_snapshot
+
+ORB_COUNTS = [40, 1000, 10000]
+PROJECTILE_COUNT = 20
+FRAME_BUDGET_MS = 1000 / 60
+
+def make_game(orb_count, numpy_orb_engine):
+    game = Game(numpy_orb_engine=numpy_orb_engine, seed=0)
+    game.setup_level("hard")
+    rng = random.Random(1)
+    game.orbs.empty()
+    for i in range(orb_count):
+        angle = (i / orb_count) * 2 * math.pi
+        speed = 0.005 + rng.uniform(-0.001, 0.001)
+        game.orbs.add(Orb(rng.choice(COLORS[:5]), ring_radius(i), angle, speed, game.center))
+    game.setup_backends()
+    game.lives = 1000 # Keep the level running through the misses
+    for i in range(PROJECTILE_COUNT):
+        game.fire(i * 2 * math.pi / PROJECTILE_COUNT)
+    game.step()
+    return game
+
+def time_call(func, repeats):
+    start = time.perf_counter()
+    for _ in range(repeats):
+        result = func()
+    return (time.perf_counter() - start) * 1000 / repeats, result
+
+def main():
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    print(f"{'orbs':>6} {'orbs as':>8} {'bytes':>9} {'bytes/orb':>10} {'take ms':>8} {'restore ms':>11} {'exact':>6}")
+    for count in ORB_COUNTS:
+        for numpy_orb_engine in (False, True):
+            game = make_game(count, numpy_orb_engine)
+            take_ms, data = time_call(lambda: take_snapshot(game), repeats)
+            copy = Game(numpy_orb_engine=numpy_orb_engine, seed=1)
+            restore_ms, _ = time_call(lambda: restore_snapshot(copy, data), repeats)
+            for _ in range(30):
+                game.step()
+                copy.step()
+            exact = take_snapshot(game) == take_snapshot(copy)
+            label = "engine" if numpy_orb_engine else "sprites"
+            print(f"{count:>6} {label:>8} {len(data):>9} {len(data) / count:>10.1f} {take_ms:>8.3f} "
+                  f"{restore_ms:>11.3f} {str(exact):>6}")
+    print(f"frame budget at 60 FPS: {FRAME_BUDGET_MS:.1f} ms")
+
+if __name__ == "__main__":
+    main()
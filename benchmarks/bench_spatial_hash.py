@@ -0,0 +1,71 @@
+"""
+"Bullet hell" load: thousands of projectiles against the orbs.
+
+Compares pygame.sprite.groupcollide with GridCollider, whose SpatialHash
+grids are kept up to date incrementally as the sprites move. Each row also
+checks the grid against a brute-force circle-vs-circle test.
+
+    python benchmarks/bench_spatial_hash.py [frames]
+"""
+import os
+import sys
+import time
+import math
+import random
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+import orbital_match as game
+from collision import GridCollider
+from layouts import make_orbs
+
+LOADS = [(40, 1000), (40, 5000), (1000, 1000), (1000, 5000)]
+FRAME_BUDGET_MS = 1000 / game.FPS
+SPEED_MODIFIER = 3.0 # Neptune
+CENTER = (game.SCREEN_WIDTH // 2, game.SCREEN_HEIGHT // 2)
+
+def make_level(orb_count, projectile_count):
+    orbs = make_orbs(orb_count, CENTER, game.Orb)
+    random.seed(0)
+    projectiles = pygame.sprite.Group()
+    for _ in range(projectile_count):
+        x = random.uniform(0, game.SCREEN_WIDTH)
+        y = random.uniform(0, game.SCREEN_HEIGHT)
+        projectiles.add(game.Projectile(x, y, game.RED, random.uniform(0, 2 * math.pi)))
+    return orbs, projectiles
+
+def circle_hits(projectiles, orbs):
+    crashed = {}
+    for projectile in projectiles:
+        hits = [orb for orb in orbs
+                if math.dist(projectile.rect.center, orb.rect.center) < (projectile.rect.width + orb.rect.width) / 2]
+        if hits:
+            crashed[projectile] = hits
+    return crashed
+
+def run(orbs, projectiles, frames, collide):
+    start = time.perf_counter()
+    for _ in range(frames):
+        orbs.update(SPEED_MODIFIER)
+        projectiles.update()
+        collide(projectiles, orbs)
+    return (time.perf_counter() - start) * 1000 / frames
+
+def main():
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else 30
+    print(f"{'orbs':>5} {'projectiles':>12} {'groupcollide ms':>16} {'grid ms':>8} {'same':>5}")
+    for orb_count, projectile_count in LOADS:
+        orbs, projectiles = make_level(orb_count, projectile_count)
+        brute_ms = run(orbs, projectiles, frames,
+                       lambda a, b: pygame.sprite.groupcollide(a, b, False, False))
+        grid = GridCollider(cell_size=30)
+        grid_ms = run(orbs, projectiles, frames, lambda a, b: grid.groupcollide(a, b, False, False))
+        same = grid.groupcollide(projectiles, orbs, False, False) == circle_hits(projectiles, orbs)
+        print(f"{orb_count:>5} {projectile_count:>12} {brute_ms:>16.3f} {grid_ms:>8.3f} {str(same):>5}")
+    print(f"frame budget at {game.FPS} FPS: {FRAME_BUDGET_MS:.1f} ms (times include moving the sprites)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""
+Cold start time of each game script, from launch to the first title frame.
+
+Every sample is a fresh interpreter that imports the script and draws the
+title screen once, so module caches and an already initialized pygame do not
+flatter the numbers. Reports the median time to the first frame as measured
+inside the process, the part of it spent importing pygame itself (which the
+scripts cannot change), and the wall time of the whole process including
+interpreter start-up. Runs with the SDL dummy drivers.
+
+    python benchmarks/bench_startup.py [samples]
+"""
+import os
+import sys
+import time
+import statistics
+import subprocess
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SCRIPTS = ["gaming3", "gaming2", "gamingg2", "import pygame"]
+
+# Runs in the child; prints ms to import pygame and ms to the first title frame
+CHILD = """
+import time
+started = time.perf_counter()
+import os, random, sys
+sys.path.insert(0, {root!r})
+import pygame
+pygame_ms = (time.perf_counter() - started) * 1000
+__import__({script!r})
+game = sys.modules["orbital_match"] # Every script launches the same game
+starfield = game.Starfield(game.screen.get_size(), game.STARFIELD_STARS, random.Random(0))
+game.TitleScreen(starfield).draw(game.screen)
+pygame.display.flip()
+print(pygame_ms, (time.perf_counter() - started) * 1000)
+sys.stdout.flush()
+os._exit(0)
+"""
+
+def sample(script):
+    env = dict(os.environ, SDL_VIDEODRIVER="dummy", SDL_AUDIODRIVER="dummy", PYGAME_HIDE_SUPPORT_PROMPT="1")
+    start = time.perf_counter()
+    output = subprocess.run([sys.executable, "-c", CHILD.format(root=ROOT, script=script)], env=env, cwd=ROOT,
+                            capture_output=True, text=True, check=True).stdout
+    wall_ms = (time.perf_counter() - start) * 1000
+    pygame_ms, first_frame_ms = map(float, output.split())
+    return pygame_ms, first_frame_ms, wall_ms
+
+def main():
+    samples = int(sys.argv[1]) if len(sys.argv) > 1 else 7
+    print(f"{'script':>14} {'first frame ms':>15} {'pygame import ms':>17} {'game ms':>8} {'process ms':>11}")
+    for script in SCRIPTS:
+        results = [sample(script) for _ in range(samples)]
+        pygame_ms, first_frame_ms, wall_ms = (statistics.median(column) for column in zip(*results))
+        print(f"{script:>14} {first_frame_ms:>15.1f} {pygame_ms:>17.1f} {first_frame_ms - pygame_ms:>8.1f} "
+              f"{wall_ms:>11.1f}")
+
+if __name__ == "__main__":
+    main()
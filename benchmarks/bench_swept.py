@@ -0,0 +1,67 @@
+"""
+Tunneling and cost of swept collision versus pygame.sprite.groupcollide.
+
+On the Neptune preset (40 orbs, speed modifier 3.0), single shots are
+fired at random angles and flown tick by tick until they hit an orb or leave
+the screen. The per-tick rect test lets fast shots jump over orbs; the swept
+test checks the whole path. The collision pass is timed for both.
+
+    python benchmarks/bench_swept.py [shots]
+"""
+import os
+import sys
+import time
+import math
+import random
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+import orbital_match as game
+from collision import SweptCollider
+from layouts import make_orbs
+
+SPEEDS = [15, 45, 90, 150]
+ORB_COUNT = 40
+SPEED_MODIFIER = 3.0 # Neptune
+CENTER = (game.SCREEN_WIDTH // 2, game.SCREEN_HEIGHT // 2)
+
+def play(collide, shots, speed):
+    orbs = make_orbs(ORB_COUNT, CENTER, game.Orb, colors=[game.RED])
+    orbs.update(SPEED_MODIFIER)
+    aim = random.Random(1)
+    screen_rect = pygame.Rect(0, 0, game.SCREEN_WIDTH, game.SCREEN_HEIGHT)
+    hits = 0
+    collide_seconds = 0.0
+    ticks = 0
+    for _ in range(shots):
+        angle = aim.uniform(0, 2 * math.pi)
+        projectiles = pygame.sprite.Group(game.Projectile(CENTER[0], CENTER[1], game.RED, angle, speed))
+        while projectiles:
+            orbs.update(SPEED_MODIFIER)
+            projectiles.update()
+            for projectile in projectiles.copy():
+                if not screen_rect.colliderect(projectile.rect):
+                    projectile.kill()
+            start = time.perf_counter()
+            collided = collide(projectiles, orbs)
+            collide_seconds += time.perf_counter() - start
+            ticks += 1
+            if collided:
+                hits += 1
+                projectiles.empty()
+    return hits / shots, collide_seconds * 1e6 / ticks
+
+def main():
+    shots = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    swept = SweptCollider(CENTER, SPEED_MODIFIER)
+    print(f"{'speed':>6} {'rect hit %':>11} {'swept hit %':>12} {'rect us/tick':>13} {'swept us/tick':>14}")
+    for speed in SPEEDS:
+        rect_rate, rect_us = play(lambda a, b: pygame.sprite.groupcollide(a, b, False, False), shots, speed)
+        swept_rate, swept_us = play(lambda a, b: swept.groupcollide(a, b, False, False), shots, speed)
+        print(f"{speed:>6} {rect_rate:>11.0%} {swept_rate:>12.0%} {rect_us:>13.1f} {swept_us:>14.1f}")
+
+if __name__ == "__main__":
+    main()
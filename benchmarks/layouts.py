@@ -0,0 +1,19 @@
+"""
+Orb layouts shared by the benchmarks.
+"""
+import math
+import random
+
+import pygame
+from simulation import COLORS, Orb, ring_radius
+
+def make_orbs(count, center, orb_class=Orb, colors=COLORS[:5], seed=0, random_angles=False):
+    # count orbs dealt onto the three rings as Game.setup_level does, evenly spaced unless random_angles
+    rng = random.Random(seed)
+    orbs = pygame.sprite.Group()
+    for i in range(count):
+        color = rng.choice(colors)
+        angle = rng.uniform(0, 2 * math.pi) if random_angles else (i / count) * 2 * math.pi
+        speed = 0.005 + rng.uniform(-0.001, 0.001)
+        orbs.add(orb_class(color, ring_radius(i), angle, speed, center))
+    return orbs
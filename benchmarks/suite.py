@@ -0,0 +1,208 @@
+"""
+Fixed benchmark suite for the game's hot paths, with a history of runs.
+
+Every workload runs headless with the SDL dummy drivers and is timed as the
+median of several repeats. "run" appends one JSON line per run to the
+history file (timestamp, label, Python/pygame versions and the median ms of
+each workload); "compare" checks the latest run against an earlier one and
+exits with status 1 if any workload got slower by more than --threshold
+percent, so it can gate a CI job.
+
+    python benchmarks/suite.py run [--label LABEL] [--repeat 7] [--only orb_update ...]
+    python benchmarks/suite.py compare [--baseline -2] [--threshold 10]
+    python benchmarks/suite.py list
+"""
+import argparse
+import datetime
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+import math
+import random
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+import orbital_match as game
+import skins
+from layouts import make_orbs
+from simulation import Game
+from tournament import lead_policy
+
+HISTORY_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "history.jsonl")
+ORB_COUNTS = [40, 1000, 10000]
+COLLIDE_LOAD = (1000, 50) # Orbs, projectiles in flight
+SPEED_MODIFIER = 3.0 # Neptune
+CENTER = (game.SCREEN_WIDTH // 2, game.SCREEN_HEIGHT // 2)
+
+# --- Workloads ---
+# Each one sets up its data and returns (call, number): call() is timed number times per repeat
+def orb_surfaces():
+    return lambda: [skins.create_orb_3d_surface(color) for color in game.COLORS], 5
+
+def projectile_surfaces():
+    return lambda: [skins.create_projectile_3d_surface(color) for color in game.COLORS], 5
+
+def launcher_draw(skin_name):
+    def setup():
+        game.select_skin(skin_name)
+        launcher = game.Launcher()
+        angles = [i * 2 * math.pi / 360 for i in range(360)]
+
+        def call():
+            # One full turn of the aim, as the mouse circles the launcher
+            for angle in angles:
+                launcher.angle = angle
+                launcher.draw(game.screen)
+        return call, 3
+    return setup
+
+def orb_update(count):
+    def setup():
+        orbs = make_orbs(count, CENTER, game.Orb)
+        return lambda: orbs.update(SPEED_MODIFIER), max(1, 20000 // count)
+    return setup
+
+def groupcollide():
+    orb_count, projectile_count = COLLIDE_LOAD
+    orbs = make_orbs(orb_count, CENTER, game.Orb)
+    orbs.update(SPEED_MODIFIER)
+    rng = random.Random(1)
+    projectiles = pygame.sprite.Group()
+    for _ in range(projectile_count):
+        angle = rng.uniform(0, 2 * math.pi)
+        distance = rng.uniform(0, 350)
+        projectiles.add(game.Projectile(CENTER[0] + distance * math.cos(angle),
+                                        CENTER[1] + distance * math.sin(angle), game.COLORS[0], angle))
+    return lambda: pygame.sprite.groupcollide(projectiles, orbs, False, False), 20
+
+def neptune_round():
+    # A whole seeded Neptune level played by the lead bot and drawn every tick, in the default skin
+    game.select_skin(game.SKIN)
+
+    def call():
+        level = Game(game.SCREEN_WIDTH, game.SCREEN_HEIGHT, orb_class=game.Orb, projectile_class=game.Projectile,
+                     seed=0)
+        level.setup_level("hard")
+        launcher = game.Launcher()
+        rng = random.Random("0/policy")
+        while level.state == "playing" and level.ticks < 60 * 60:
+            angle = lead_policy(level, rng)
+            if angle is not None:
+                launcher.angle = angle
+                level.fire(angle)
+            level.step()
+            game.screen.fill(game.BLACK)
+            launcher.draw(game.screen)
+            level.orbs.draw(game.screen)
+            level.projectiles.draw(game.screen)
+            game.draw_hud(game.screen, level.score, level.lives, level.combo_count, level.next_projectile_color)
+            pygame.display.flip()
+    return call, 1
+
+WORKLOADS = {
+    "orb_3d_surface": orb_surfaces,
+    "projectile_3d_surface": projectile_surfaces,
+    **{f"launcher_draw[{name}]": launcher_draw(name) for name in skins.SKINS},
+    **{f"orb_update[{count}]": orb_update(count) for count in ORB_COUNTS},
+    f"groupcollide[{COLLIDE_LOAD[0]}x{COLLIDE_LOAD[1]}]": groupcollide,
+    "neptune_round": neptune_round,
+}
+
+def measure(setup, repeat):
+    # Median and fastest ms per call over repeat timed batches
+    call, number = setup()
+    call() # Warm up caches
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            call()
+        times.append((time.perf_counter() - start) * 1000 / number)
+    return statistics.median(times), min(times)
+
+# --- History ---
+def load_history(path):
+    if not os.path.exists(path):
+        return []
+    with open(path) as file:
+        return [json.loads(line) for line in file if line.strip()]
+
+def run(args):
+    names = [name for name in WORKLOADS if not args.only or any(name.startswith(prefix) for prefix in args.only)]
+    results = {}
+    print(f"{'workload':>28} {'median ms':>10} {'min ms':>9}")
+    for name in names:
+        median_ms, min_ms = measure(WORKLOADS[name], args.repeat)
+        results[name] = {"median_ms": median_ms, "min_ms": min_ms}
+        print(f"{name:>28} {median_ms:>10.3f} {min_ms:>9.3f}")
+    entry = {
+        "time": datetime.datetime.now().isoformat(timespec="seconds"),
+        "label": args.label,
+        "python": platform.python_version(),
+        "pygame": pygame.version.ver,
+        "machine": platform.machine(),
+        "repeat": args.repeat,
+        "results": results,
+    }
+    with open(args.history, "a") as file:
+        file.write(json.dumps(entry) + "\n")
+    print(f"run appended to {args.history}")
+
+def compare(args):
+    history = load_history(args.history)
+    if len(history) < 2:
+        print(f"{args.history} needs at least two runs to compare")
+        return 2
+    baseline, latest = history[args.baseline], history[-1]
+    print(f"baseline {baseline['time']} {baseline['label'] or ''}".rstrip())
+    print(f"latest   {latest['time']} {latest['label'] or ''}".rstrip())
+    print(f"{'workload':>28} {'baseline ms':>12} {'latest ms':>10} {'change':>8}")
+    regressions = []
+    for name, result in latest["results"].items():
+        if name not in baseline["results"]:
+            continue
+        before = baseline["results"][name]["median_ms"]
+        after = result["median_ms"]
+        change = (after - before) / before * 100 if before else 0.0
+        flag = ""
+        if change > args.threshold:
+            flag = "  REGRESSION"
+            regressions.append(name)
+        print(f"{name:>28} {before:>12.3f} {after:>10.3f} {change:>+7.1f}%{flag}")
+    if regressions:
+        print(f"{len(regressions)} workload(s) slower than the baseline by more than {args.threshold:g}%")
+        return 1
+    print(f"no regressions beyond {args.threshold:g}%")
+    return 0
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run the Orbital Match benchmark suite and compare runs.")
+    parser.add_argument("--history", default=HISTORY_PATH, help="JSON lines file of past runs")
+    commands = parser.add_subparsers(dest="command", required=True)
+    run_parser = commands.add_parser("run", help="run the workloads and append the results to the history")
+    run_parser.add_argument("--label", default="", help="note stored with the run, e.g. a commit")
+    run_parser.add_argument("--repeat", type=int, default=7, help="timed batches per workload; the median is kept")
+    run_parser.add_argument("--only", nargs="+", help="workload name prefixes to run")
+    compare_parser = commands.add_parser("compare", help="compare the latest run against an earlier one")
+    compare_parser.add_argument("--baseline", type=int, default=-2,
+                                help="history index of the run to compare against (default: the one before last)")
+    compare_parser.add_argument("--threshold", type=float, default=10.0, help="percent slowdown that counts")
+    commands.add_parser("list", help="list the workloads")
+    args = parser.parse_args(argv)
+
+    if args.command == "list":
+        print("\n".join(WORKLOADS))
+        return 0
+    if args.command == "compare":
+        return compare(args)
+    run(args)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,385 @@
+import math
+
+class RingCollider:
+    """
+    Collision backend for orbs that travel on fixed rings around a center.
+
+    Orbs are bucketed by ring and angular sector. A projectile is only tested
+    against the rings it is currently crossing and the sectors next to its own
+    angle, instead of against every orb. groupcollide() returns the same dict
+    as pygame.sprite.groupcollide, with orbs listed in group order.
+
+    The buckets are kept from tick to tick. Sectors are counted in a frame
+    that turns at the orbs' average speed, so an orb only drifts through them
+    at the difference between its own speed and the average. An orb turns by
+    speed * speed_modifier every tick, so the tick it leaves its sector on is
+    known in advance, and only the orbs due on a tick are moved to another
+    bucket. groupcollide() must be called once per tick, after the orbs moved,
+    and the orbs need up-to-date angle/speed/radius, as Orb keeps them.
+    """
+    def __init__(self, center, speed_modifier=1.0, sector_count=128):
+        self.center_x, self.center_y = center
+        self.speed_modifier = speed_modifier
+        self.sector_count = sector_count
+        self.sector_scale = sector_count / (2 * math.pi)
+        self.buckets = {}
+        self.ring_radii = []
+        self.order = {}
+        self.orb_reach = 0
+        self.group = None # The orb group the buckets were built for
+        self.members = {} # Bucket key of every orb
+        self.due = {} # Orbs by the tick they leave their sector on
+        self.tick = 0
+        self.placed_tick = 0 # Last tick whose due orbs were moved
+        self.frame_angle = 0.0 # How far the sector frame has turned
+        self.frame_turn = 0.0 # Radians the sector frame turns per tick
+
+    def _sector(self, dx, dy):
+        return int((math.atan2(dy, dx) + math.pi - self.frame_angle) % (2 * math.pi) * self.sector_scale) \
+            % self.sector_count
+
+    def _place(self, orb):
+        # Bucket an orb by its angle in the sector frame and schedule the tick it leaves the sector on
+        angle = (orb.angle + math.pi - self.frame_angle) % (2 * math.pi)
+        sector = int(angle * self.sector_scale) % self.sector_count
+        key = (orb.radius, sector)
+        # Buckets are dicts used as ordered sets
+        self.buckets.setdefault(key, {})[orb] = None
+        self.members[orb] = key
+        turn = orb.speed * self.speed_modifier - self.frame_turn
+        if turn > 0:
+            ticks = math.ceil(((sector + 1) / self.sector_scale - angle) / turn)
+        elif turn < 0:
+            ticks = math.ceil((angle - sector / self.sector_scale) / -turn)
+        else:
+            return
+        self.due.setdefault(self.tick + max(1, ticks), []).append(orb)
+
+    def _remove(self, orb):
+        key = self.members.pop(orb)
+        bucket = self.buckets[key]
+        del bucket[orb]
+        if not bucket:
+            del self.buckets[key]
+
+    def rebuild(self, orbs):
+        self.group = orbs
+        self.buckets = {}
+        self.members = {}
+        self.due = {}
+        self.placed_tick = self.tick
+        self.frame_angle = 0.0
+        self.frame_turn = sum(orb.speed for orb in orbs) * self.speed_modifier / len(orbs) if orbs else 0.0
+        self.order = {}
+        ring_radii = set()
+        orb_reach = 0
+        for index, orb in enumerate(orbs):
+            self._place(orb)
+            self.order[orb] = index
+            ring_radii.add(orb.radius)
+            orb_reach = max(orb_reach, orb.rect.width, orb.rect.height)
+        self.ring_radii = sorted(ring_radii)
+        self.orb_reach = orb_reach
+
+    def update(self, orbs):
+        # Bring the buckets up to the current tick
+        if orbs is not self.group:
+            self.rebuild(orbs)
+            return
+        if len(self.members) > len(orbs):
+            # Forget orbs that were killed since the last update
+            for orb in [orb for orb in self.members if not orbs.has(orb)]:
+                self._remove(orb)
+        if len(self.members) != len(orbs):
+            self.rebuild(orbs)
+            return
+        # Only orbs that reached the end of their sector move; everything else stays put
+        for tick in range(self.placed_tick + 1, self.tick + 1):
+            for orb in self.due.pop(tick, ()):
+                if orb in self.members:
+                    self._remove(orb)
+                    self._place(orb)
+        self.placed_tick = self.tick
+
+    def candidates(self, sprite):
+        rect = sprite.rect
+        dx = rect.centerx - self.center_x
+        dy = rect.centery - self.center_y
+        distance = math.hypot(dx, dy)
+        # Farthest apart two centers can be while their rects still overlap
+        reach = math.hypot(self.orb_reach + rect.width, self.orb_reach + rect.height) / 2 + 2
+        sector = self._sector(dx, dy)
+
+        found = []
+        for radius in self.ring_radii:
+            if abs(distance - radius) > reach:
+                continue
+            inner = radius - reach
+            if inner <= reach:
+                # Too close to the center for sectors to help; check the whole ring
+                span = self.sector_count // 2
+            else:
+                span = int(math.asin(reach / inner) * self.sector_scale) + 1
+            span = min(span, self.sector_count // 2)
+            for offset in range(-span, span + 1):
+                if offset == span and 2 * span == self.sector_count:
+                    break # Both ends of a full sweep are the same sector
+                bucket = self.buckets.get((radius, (sector + offset) % self.sector_count))
+                if bucket:
+                    found.extend(bucket)
+        return found
+
+    def spritecollide(self, sprite):
+        rect = sprite.rect
+        hits = [orb for orb in self.candidates(sprite) if rect.colliderect(orb.rect)]
+        hits.sort(key=self.order.__getitem__)
+        return hits
+
+    def groupcollide(self, groupa, groupb, dokilla, dokillb):
+        # Same arguments and result as pygame.sprite.groupcollide(groupa, groupb, ...)
+        crashed = {}
+        self.tick += 1
+        self.frame_angle += self.frame_turn
+        if not groupa:
+            # Moving the orbs that are due can wait until there is something to test
+            return crashed
+        self.update(groupb)
+        for sprite in groupa.sprites():
+            hits = self.spritecollide(sprite)
+            if dokillb:
+                # Orbs killed by an earlier projectile are out of the running
+                hits = [orb for orb in hits if groupb.has(orb)]
+            if hits:
+                crashed[sprite] = hits
+                if dokilla:
+                    sprite.kill()
+                if dokillb:
+                    for orb in hits:
+                        orb.kill()
+        return crashed
+
+class SweptCollider(RingCollider):
+    """
+    Continuous collision for fast projectiles against orbs on their rings.
+
+    Each tick a projectile is a circle sweeping the segment from its previous
+    to its current position, and an orb is a circle moving along its arc from
+    its previous angle, so neither can skip past the other between ticks. The
+    arc is split into straight pieces of at most max_arc_step radians.
+    Orbs need up-to-date angle/speed/radius and projectiles float x/y and
+    velocity_x/velocity_y, as Orb and Projectile keep them.
+    """
+    def __init__(self, center, speed_modifier, sector_count=128, max_arc_step=0.05):
+        super().__init__(center, speed_modifier, sector_count)
+        self.max_arc_step = max_arc_step
+        self.max_orb_travel = 0
+
+    def rebuild(self, orbs):
+        super().rebuild(orbs)
+        # Farthest any orb moves along its arc in a tick
+        self.max_orb_travel = max((orb.radius * abs(orb.speed) * self.speed_modifier for orb in orbs), default=0)
+
+    def _segment(self, sprite):
+        # Projectile path over the last tick, relative to the center
+        x1 = sprite.x - self.center_x
+        y1 = sprite.y - self.center_y
+        return x1 - sprite.velocity_x, y1 - sprite.velocity_y, x1, y1
+
+    def candidates(self, sprite):
+        x0, y0, x1, y1 = self._segment(sprite)
+        reach = (sprite.rect.width + self.orb_reach) / 2 + self.max_orb_travel + 2
+
+        # Closest and farthest the path gets from the center
+        dx = x1 - x0
+        dy = y1 - y0
+        length_squared = dx * dx + dy * dy
+        t = 0.0 if length_squared == 0 else max(0.0, min(1.0, -(x0 * dx + y0 * dy) / length_squared))
+        near = math.hypot(x0 + dx * t, y0 + dy * t)
+        far = max(math.hypot(x0, y0), math.hypot(x1, y1))
+
+        # Sectors swept by the path, starting from its lower-angle end
+        start_angle = math.atan2(y0, x0)
+        sweep = (math.atan2(y1, x1) - start_angle + math.pi) % (2 * math.pi) - math.pi
+        if sweep < 0:
+            start_angle += sweep
+            sweep = -sweep
+        start_sector = math.floor((start_angle + math.pi - self.frame_angle) * self.sector_scale)
+        sweep_sectors = int(sweep * self.sector_scale) + 1
+
+        found = []
+        for radius in self.ring_radii:
+            if radius < near - reach or radius > far + reach:
+                continue
+            inner = radius - reach
+            if inner <= reach or near <= reach:
+                # The path passes too close to the center for sectors to help
+                first, count = 0, self.sector_count
+            else:
+                margin = int(math.asin(reach / inner) * self.sector_scale) + 1
+                first = start_sector - margin
+                count = min(sweep_sectors + 2 * margin + 1, self.sector_count)
+            for sector in range(first, first + count):
+                bucket = self.buckets.get((radius, sector % self.sector_count))
+                if bucket:
+                    found.extend(bucket)
+        return found
+
+    def swept_hit(self, sprite, orb):
+        x0, y0, x1, y1 = self._segment(sprite)
+        reach = (sprite.rect.width + orb.rect.width) / 2
+        reach_squared = reach * reach
+
+        # Walk the orb's arc from its previous angle in short straight pieces
+        arc = orb.speed * self.speed_modifier
+        pieces = max(1, math.ceil(abs(arc) / self.max_arc_step))
+        angle = orb.angle - arc
+        orb_x = orb.radius * math.cos(angle)
+        orb_y = orb.radius * math.sin(angle)
+        step_x = (x1 - x0) / pieces
+        step_y = (y1 - y0) / pieces
+        for piece in range(1, pieces + 1):
+            next_angle = orb.angle - arc + arc * piece / pieces
+            next_x = orb.radius * math.cos(next_angle)
+            next_y = orb.radius * math.sin(next_angle)
+            # Offset from orb to projectile and how it changes over this piece
+            offset_x = x0 - orb_x
+            offset_y = y0 - orb_y
+            change_x = step_x - (next_x - orb_x)
+            change_y = step_y - (next_y - orb_y)
+            change_squared = change_x * change_x + change_y * change_y
+            if change_squared == 0:
+                t = 0.0
+            else:
+                t = max(0.0, min(1.0, -(offset_x * change_x + offset_y * change_y) / change_squared))
+            closest_x = offset_x + change_x * t
+            closest_y = offset_y + change_y * t
+            if closest_x * closest_x + closest_y * closest_y < reach_squared:
+                return True
+            x0 += step_x
+            y0 += step_y
+            orb_x = next_x
+            orb_y = next_y
+        return False
+
+    def spritecollide(self, sprite):
+        hits = [orb for orb in self.candidates(sprite) if self.swept_hit(sprite, orb)]
+        hits.sort(key=self.order.__getitem__)
+        return hits
+
+class SpatialHash:
+    """
+    Uniform grid broad phase for sprites that are not tied to rings.
+
+    Sprites are binned by their rect center into square cells at least as big
+    as the largest sprite, so anything a sprite can touch is in its own cell
+    or one of the eight around it. update() only moves sprites whose cell changed.
+    spritecollide() confirms candidates with a circle-vs-circle test.
+    """
+    def __init__(self, cell_size=30):
+        self.cell_size = cell_size
+        self.cells = {}
+        self.keys = {}
+        self.order = {}
+
+    def _key(self, rect):
+        return (rect.centerx // self.cell_size, rect.centery // self.cell_size)
+
+    def _remove(self, sprite):
+        key = self.keys.pop(sprite)
+        cell = self.cells[key]
+        del cell[sprite]
+        if not cell:
+            del self.cells[key]
+
+    def update(self, group):
+        sprites = group.sprites()
+        membership_changed = False
+        for sprite in sprites:
+            key = self._key(sprite.rect)
+            old_key = self.keys.get(sprite)
+            if old_key != key:
+                if old_key is None:
+                    membership_changed = True
+                else:
+                    self._remove(sprite)
+                self.keys[sprite] = key
+                # Cells are dicts used as ordered sets
+                self.cells.setdefault(key, {})[sprite] = None
+
+        if len(self.keys) > len(sprites):
+            # Forget sprites that were killed since the last update
+            members = set(sprites)
+            for sprite in [sprite for sprite in self.keys if sprite not in members]:
+                self._remove(sprite)
+            membership_changed = True
+        if membership_changed:
+            self.order = {sprite: index for index, sprite in enumerate(sprites)}
+
+    def spritecollide(self, sprite):
+        rect = sprite.rect
+        x, y = rect.center
+        radius = rect.width / 2
+        cell_x, cell_y = self._key(rect)
+        hits = []
+        for neighbor_x in (cell_x - 1, cell_x, cell_x + 1):
+            for neighbor_y in (cell_y - 1, cell_y, cell_y + 1):
+                cell = self.cells.get((neighbor_x, neighbor_y))
+                if not cell:
+                    continue
+                for other in cell:
+                    other_rect = other.rect
+                    dx = other_rect.centerx - x
+                    dy = other_rect.centery - y
+                    reach = radius + other_rect.width / 2
+                    if dx * dx + dy * dy < reach * reach:
+                        hits.append(other)
+        if len(hits) > 1:
+            hits.sort(key=self.order.__getitem__)
+        return hits
+
+class GridCollider:
+    """
+    groupcollide replacement built on two SpatialHash grids, one per group.
+
+    Whichever group is smaller is walked and the other group's grid is
+    queried, so a few orbs against thousands of projectiles stays cheap.
+    """
+    def __init__(self, cell_size=30):
+        self.grid_a = SpatialHash(cell_size)
+        self.grid_b = SpatialHash(cell_size)
+
+    def groupcollide(self, groupa, groupb, dokilla, dokillb):
+        # Same arguments and result shape as pygame.sprite.groupcollide
+        self.grid_b.update(groupb)
+        if not groupa:
+            return {}
+        if len(groupa) <= len(groupb):
+            found = {}
+            for sprite in groupa.sprites():
+                hits = self.grid_b.spritecollide(sprite)
+                if hits:
+                    found[sprite] = hits
+        else:
+            self.grid_a.update(groupa)
+            found = {}
+            for other in groupb.sprites():
+                for sprite in self.grid_a.spritecollide(other):
+                    found.setdefault(sprite, []).append(other)
+            order = self.grid_a.order
+            found = {sprite: found[sprite] for sprite in sorted(found, key=order.__getitem__)}
+
+        if not (dokilla or dokillb):
+            return found
+        crashed = {}
+        for sprite, hits in found.items():
+            if dokillb:
+                # Sprites killed for an earlier hit are out of the running
+                hits = [other for other in hits if groupb.has(other)]
+            if hits:
+                crashed[sprite] = hits
+                if dokilla:
+                    sprite.kill()
+                if dokillb:
+                    for other in hits:
+                        other.kill()
+        return crashed
@@ -0,0 +1,74 @@
+import random
+import pygame
+
+class ColorRegistry:
+    """
+    Live count of how many orbs of each color are left.
+
+    The colors still present are kept in a list with an index map, so adding,
+    removing and picking a random present color are all O(1).
+    """
+    def __init__(self):
+        self.counts = {}
+        self.present = []
+        self.positions = {}
+
+    def __len__(self):
+        return len(self.present)
+
+    def __contains__(self, color):
+        return color in self.positions
+
+    def add(self, color):
+        count = self.counts.get(color, 0)
+        self.counts[color] = count + 1
+        if count == 0:
+            self.positions[color] = len(self.present)
+            self.present.append(color)
+
+    def remove(self, color):
+        count = self.counts[color] - 1
+        if count > 0:
+            self.counts[color] = count
+            return
+        del self.counts[color]
+        # Swap the last present color into the freed slot
+        index = self.positions.pop(color)
+        last = self.present.pop()
+        if last != color:
+            self.present[index] = last
+            self.positions[last] = index
+
+    def set_order(self, present):
+        # Put the present colors in a saved order, which random_color() depends on
+        self.present = list(present)
+        self.positions = {color: index for index, color in enumerate(self.present)}
+
+    def random_color(self, weighted=False, rng=random):
+        # None once every orb is gone
+        if not self.present:
+            return None
+        if weighted:
+            # Colors with more orbs left are picked more often
+            return rng.choices(self.present, [self.counts[color] for color in self.present])[0]
+        return self.present[rng.randrange(len(self.present))]
+
+class ColorTrackingGroup(pygame.sprite.Group):
+    """
+    Sprite group that keeps a ColorRegistry of its members' colors.
+
+    The registry is updated from add_internal/remove_internal, so it stays
+    right however a sprite leaves the group (kill(), remove(), empty()), and
+    an orb killed twice in the same frame is only counted once.
+    """
+    def __init__(self, *sprites):
+        self.colors = ColorRegistry()
+        super().__init__(*sprites)
+
+    def add_internal(self, sprite, layer=None):
+        super().add_internal(sprite, layer)
+        self.colors.add(sprite.color)
+
+    def remove_internal(self, sprite):
+        super().remove_internal(sprite)
+        self.colors.remove(sprite.color)
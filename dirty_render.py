@@ -0,0 +1,54 @@
+import pygame
+
+class DirtyRenderer:
+    """
+    Opt-in renderer that only repaints the parts of the screen that changed.
+
+    Sprites are kept in a pygame.sprite.RenderUpdates group, which remembers
+    where each sprite was drawn last frame. Everything else (launcher, HUD)
+    reports the rects it drew, and those are erased on the next frame.
+    Only the union of the old and new areas is pushed with display.update.
+    """
+    def __init__(self, screen, background_color):
+        self.screen = screen
+        self.background_color = background_color
+        self._background = None
+        self.previous_rects = []
+        self.full_redraw = True
+
+    @property
+    def background(self):
+        # Built on first use, so a game that never renders dirty does not pay for it at startup
+        if self._background is None:
+            self._background = pygame.Surface(self.screen.get_size()).convert()
+            self._background.fill(self.background_color)
+        return self._background
+
+    def set_background(self, surface):
+        # Erase with this surface (e.g. a starfield) instead of the plain color
+        self._background = surface
+        self.full_redraw = True
+
+    def reset(self):
+        # Something else drew over the whole screen (menus, end screens)
+        self.previous_rects = []
+        self.full_redraw = True
+
+    def clear(self, *groups):
+        if self.full_redraw:
+            self.screen.blit(self.background, (0, 0))
+            return
+        # Erase sprites where they were last drawn, then the other drawings
+        for group in groups:
+            group.clear(self.screen, self.background)
+        for rect in self.previous_rects:
+            self.screen.blit(self.background, rect, rect)
+
+    def present(self, sprite_rects, drawn_rects):
+        # sprite_rects come from RenderUpdates.draw and already include old positions
+        if self.full_redraw:
+            pygame.display.flip()
+            self.full_redraw = False
+        else:
+            pygame.display.update(sprite_rects + self.previous_rects + drawn_rects)
+        self.previous_rects = drawn_rects
@@ -0,0 +1,132 @@
+from collections import OrderedDict
+import pygame
+
+class TextCache:
+    """
+    Rendered text surfaces keyed by (font, text, color).
+
+    A label is only rasterized again when its text or color actually changes.
+    The least recently used entries are dropped once max_entries is reached.
+    """
+    def __init__(self, max_entries=256):
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, font, text, color, antialias=True):
+        key = (font, text, color, antialias)
+        surface = self.entries.get(key)
+        if surface is not None:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        surface = font.render(text, antialias, color)
+        self.entries[key] = surface
+        if len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+        return surface
+
+class LazyFont:
+    """
+    Stands in for a pygame.font.Font that is only loaded, and the font module
+    only initialized, the first time it is used.
+    """
+    def __init__(self, file, point_size):
+        self.file = file
+        self.point_size = point_size
+        self.font = None
+
+    def load(self):
+        if self.font is None:
+            if not pygame.font.get_init():
+                pygame.font.init()
+            self.font = pygame.font.Font(self.file, self.point_size)
+        return self.font
+
+    def __getattr__(self, name):
+        # render(), size(), get_height() and the rest come from the real font
+        return getattr(self.load(), name)
+
+class DigitRenderer:
+    """
+    Draws a number from pre-rendered digit glyphs, with an optional fixed
+    prefix and suffix, so a changing counter never calls the font rasterizer.
+    The glyphs are rendered the first time a number is drawn or measured.
+    """
+    def __init__(self, font, color, prefix="", suffix=""):
+        self.font = font
+        self.color = color
+        self.prefix_text = prefix
+        self.suffix_text = suffix
+        self.glyphs = None
+
+    def _render(self, text):
+        return self.font.render(text, True, self.color), self.font.size(text)[0]
+
+    def _build(self):
+        # Each piece is (surface, advance); the advance keeps trailing spaces
+        self.glyphs = {char: self._render(char) for char in "0123456789-"}
+        self.prefix = self._render(self.prefix_text) if self.prefix_text else None
+        self.suffix = self._render(self.suffix_text) if self.suffix_text else None
+
+    def _pieces(self, value):
+        if self.glyphs is None:
+            self._build()
+        pieces = [self.glyphs[char] for char in str(value)]
+        if self.prefix is not None:
+            pieces.insert(0, self.prefix)
+        if self.suffix is not None:
+            pieces.append(self.suffix)
+        return pieces
+
+    def width(self, value):
+        return sum(advance for _, advance in self._pieces(value))
+
+    def draw(self, surface, value, pos):
+        # Lay the glyphs out left to right and blit them in one call
+        x, y = pos
+        blit_list = []
+        for glyph, advance in self._pieces(value):
+            blit_list.append((glyph, (x, y)))
+            x += advance
+        rects = surface.blits(blit_list)
+        return rects[0].unionall(rects[1:])
+
+class IconSet:
+    """
+    HUD icons (hearts, color swatches, power-ups) drawn once and reused.
+
+    Repeated icons such as the row of lives are composed into a single strip
+    when the count changes, so drawing them is one blit no matter how many
+    there are.
+    """
+    def __init__(self):
+        self.icons = {}
+        self.rows = {}
+
+    def add(self, name, surface):
+        # Match the display's pixel format so blitting the icon is fast
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert_alpha()
+        self.icons[name] = surface
+
+    def get(self, name):
+        return self.icons[name]
+
+    def row(self, name, count, spacing):
+        # Only the latest strip per icon is kept; it is rebuilt when the count changes
+        cached = self.rows.get(name)
+        if cached is not None and cached[0] == (count, spacing):
+            return cached[1]
+
+        icon = self.icons[name]
+        width = spacing * (count - 1) + icon.get_width() if count > 0 else 0
+        strip = pygame.Surface((width, icon.get_height()), pygame.SRCALPHA)
+        strip.blits([(icon, (i * spacing, 0)) for i in range(count)])
+        if pygame.display.get_surface() is not None:
+            strip = strip.convert_alpha()
+        self.rows[name] = ((count, spacing), strip)
+        return strip
@@ -0,0 +1,125 @@
+import time
+
+import pygame
+
+class Screen:
+    """
+    A menu or modal screen driven by pygame events instead of a busy loop.
+
+    run_screen() blocks in pygame.event.wait until something happens, hands
+    each event to handle_event() and only redraws when the screen was marked
+    dirty. A screen that animates sets frame_seconds; the wait then times out
+    at that interval and animate() is called to advance it. A static screen
+    sleeps until the next input, so an idle menu costs next to no CPU.
+    """
+    frame_seconds = None # Seconds between animation frames; None if the screen only changes on input
+
+    def __init__(self):
+        self.dirty = True
+        self.closed = False
+        self.result = None
+
+    def close(self, result=None):
+        self.closed = True
+        self.result = result
+
+    def handle_event(self, event):
+        pass
+
+    def animate(self, seconds):
+        # Called once per frame_seconds with the time since the last call; set dirty to redraw
+        pass
+
+    def draw(self, surface):
+        pass
+
+    def shown(self):
+        # Called once, right after the screen is first on the display
+        pass
+
+class QuitRequested(Exception):
+    """
+    Raised by run_screen() when the window is closed on a screen, so the
+    caller can shut down the same way as when it is closed mid-level.
+    """
+
+class CpuMeter:
+    """
+    Wall-clock and process CPU time spent in run_screen(), for reporting how
+    busy the menus are while they wait for the player. Screens opened from
+    another screen are counted once, as part of the outermost one.
+    """
+    def __init__(self):
+        self.wall_seconds = 0.0
+        self.cpu_seconds = 0.0
+        self.redraws = 0
+        self.depth = 0
+        self.wall_start = 0.0
+        self.cpu_start = 0.0
+
+    def start(self):
+        if self.depth == 0:
+            self.wall_start = time.perf_counter()
+            self.cpu_start = time.process_time()
+        self.depth += 1
+
+    def stop(self):
+        self.depth -= 1
+        if self.depth == 0:
+            self.wall_seconds += time.perf_counter() - self.wall_start
+            self.cpu_seconds += time.process_time() - self.cpu_start
+
+    def totals(self):
+        # (wall, cpu) seconds, including a screen that is still open
+        if self.depth == 0:
+            return self.wall_seconds, self.cpu_seconds
+        return (self.wall_seconds + time.perf_counter() - self.wall_start,
+                self.cpu_seconds + time.process_time() - self.cpu_start)
+
+    def report(self):
+        wall_seconds, cpu_seconds = self.totals()
+        cpu_percent = 100 * cpu_seconds / wall_seconds if wall_seconds else 0.0
+        return (f"Menus: {wall_seconds:.1f} s open, {cpu_seconds:.2f} s CPU ({cpu_percent:.1f}% of a core), "
+                f"{self.redraws} redraws")
+
+def run_screen(screen, surface, meter=None):
+    # Show screen until it closes and return its result; closing the window raises QuitRequested
+    if meter is not None:
+        meter.start()
+    try:
+        _show(screen, surface, meter)
+    finally:
+        if meter is not None:
+            meter.stop()
+    return screen.result
+
+def _show(screen, surface, meter):
+    last_frame = time.perf_counter()
+    first_frame = True
+    while not screen.closed:
+        if screen.dirty:
+            screen.draw(surface)
+            pygame.display.flip()
+            screen.dirty = False
+            if meter is not None:
+                meter.redraws += 1
+            if first_frame:
+                first_frame = False
+                screen.shown()
+        if screen.frame_seconds is None:
+            event = pygame.event.wait()
+        else:
+            # Wake up in time for the next animation frame
+            wait_ms = (last_frame + screen.frame_seconds - time.perf_counter()) * 1000
+            event = pygame.event.wait(max(1, int(wait_ms)))
+            now = time.perf_counter()
+            if now - last_frame >= screen.frame_seconds:
+                screen.animate(now - last_frame)
+                last_frame = now
+        if event.type == pygame.NOEVENT:
+            continue
+        if event.type == pygame.QUIT:
+            raise QuitRequested()
+        if event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+            screen.dirty = True
+        screen.handle_event(event)
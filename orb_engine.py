@@ -0,0 +1,118 @@
+try:
+    import numpy as np
+except ImportError: # NumPy is only needed when the engine is switched on
+    np = None
+
+class OrbEngine:
+    """
+    Alternate orb simulation for stress levels.
+
+    Every orb's angle, radius, speed and color index live in contiguous NumPy
+    arrays and are advanced together in one vectorized step, using the same
+    arithmetic as Orb.update. Collisions are tested straight from the arrays
+    with groupcollide(). The Orb sprites stay in their groups for drawing, but
+    their rects are only written back when write_back() is called, once per
+    drawn frame rather than once per tick.
+    """
+    def __init__(self, orbs, center, colors):
+        if np is None:
+            raise RuntimeError("OrbEngine needs NumPy (pip install numpy)")
+        self.center_x, self.center_y = center
+        self.sprites = list(orbs)
+        self.angle = np.array([orb.angle for orb in self.sprites], dtype=np.float64)
+        self.radius = np.array([orb.radius for orb in self.sprites], dtype=np.float64)
+        self.speed = np.array([orb.speed for orb in self.sprites], dtype=np.float64)
+        self.color_index = np.array([colors.index(orb.color) for orb in self.sprites], dtype=np.int8)
+        self.x = np.zeros(len(self.sprites), dtype=np.int64)
+        self.y = np.zeros(len(self.sprites), dtype=np.int64)
+        # Rect.center places the top-left corner at center - size // 2
+        self.rects = [orb.rect for orb in self.sprites]
+        self.width = np.array([rect.width for rect in self.rects], dtype=np.int64)
+        self.height = np.array([rect.height for rect in self.rects], dtype=np.int64)
+        self.half_width = self.width // 2
+        self.half_height = self.height // 2
+        self.rects_current = True # Whether the rects match the arrays
+
+    def __len__(self):
+        return len(self.sprites)
+
+    def remove_dead(self):
+        # Drop orbs that were killed since the last step
+        alive = np.array([sprite.alive() for sprite in self.sprites], dtype=bool)
+        self.sprites = [sprite for sprite, keep in zip(self.sprites, alive) if keep]
+        self.rects = [sprite.rect for sprite in self.sprites]
+        self.width = self.width[alive]
+        self.height = self.height[alive]
+        self.half_width = self.half_width[alive]
+        self.half_height = self.half_height[alive]
+        self.angle = self.angle[alive]
+        self.radius = self.radius[alive]
+        self.speed = self.speed[alive]
+        self.color_index = self.color_index[alive]
+        self.x = self.x[alive]
+        self.y = self.y[alive]
+
+    def step(self, speed_modifier):
+        self.angle += self.speed * speed_modifier
+        # Rect rounds float coordinates half away from zero; do the same here
+        x = self.center_x + self.radius * np.cos(self.angle)
+        y = self.center_y + self.radius * np.sin(self.angle)
+        self.x = np.trunc(x + np.copysign(0.5, x)).astype(np.int64)
+        self.y = np.trunc(y + np.copysign(0.5, y)).astype(np.int64)
+        self.rects_current = False
+
+    def write_back(self):
+        # Copy the positions of the last step into the sprites' rects; a Python loop, so only call it to draw
+        if self.rects_current:
+            return
+        lefts = (self.x - self.half_width).tolist()
+        tops = (self.y - self.half_height).tolist()
+        for rect, left, top in zip(self.rects, lefts, tops):
+            rect.x = left
+            rect.y = top
+        self.rects_current = True
+
+    def groupcollide(self, groupa, groupb, dokilla, dokillb):
+        # Same arguments and result as pygame.sprite.groupcollide(groupa, orbs, ...), tested on the arrays
+        crashed = {}
+        if not groupa:
+            return crashed
+        if len(groupb) != len(self.sprites):
+            self.remove_dead()
+        lefts = self.x - self.half_width
+        tops = self.y - self.half_height
+        rights = lefts + self.width
+        bottoms = tops + self.height
+        for sprite in groupa.sprites():
+            rect = sprite.rect
+            # Rect.colliderect: the two overlap by at least a pixel on both axes
+            overlap = (lefts < rect.right) & (rights > rect.left) & (tops < rect.bottom) & (bottoms > rect.top)
+            hits = [self.sprites[index] for index in np.flatnonzero(overlap).tolist()]
+            if dokillb:
+                # Orbs killed by an earlier projectile are out of the running
+                hits = [orb for orb in hits if groupb.has(orb)]
+            if hits:
+                crashed[sprite] = hits
+                if dokilla:
+                    sprite.kill()
+                if dokillb:
+                    for orb in hits:
+                        orb.kill()
+        return crashed
+
+    def positions(self):
+        # Exact float centers, as Orb.update computes them
+        return self.center_x + self.radius * np.cos(self.angle), self.center_y + self.radius * np.sin(self.angle)
+
+    def sync_sprites(self):
+        # Orb.angle, x and y are not updated while the engine runs; copy them back when needed
+        x, y = self.positions()
+        for sprite, angle, sprite_x, sprite_y in zip(self.sprites, self.angle.tolist(), x.tolist(), y.tolist()):
+            sprite.angle = angle
+            sprite.x = sprite_x
+            sprite.y = sprite_y
+
+    def update(self, orb_group, speed_modifier):
+        if len(orb_group) != len(self.sprites):
+            self.remove_dead()
+        self.step(speed_modifier)
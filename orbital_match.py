@@ -0,0 +1,655 @@
+import startup # First, so the startup report also covers importing pygame
+import pygame
+import random
+import math
+import simulation
+from background import Starfield, make_background
+from dirty_render import DirtyRenderer
+from hud import TextCache, DigitRenderer, IconSet, LazyFont
+from menu import CpuMeter, QuitRequested, Screen, run_screen
+from profiler import FrameProfiler
+from replay import InputRecorder
+from rewind import RewindBuffer
+from skins import SKINS
+from sprite_cache import RotationCache, SpriteAtlas
+from simulation import BLUE, COLORS, CYAN, GREEN, RED, YELLOW, Game
+from timestep import FixedTimestep
+
+# --- Game Constants ---
+SCREEN_WIDTH = 1000
+SCREEN_HEIGHT = 700
+FPS = 60
+
+# --- Colors ---
+WHITE = (255, 255, 255)
+BLACK = (0, 0, 0)
+GRAY = (50, 50, 50)
+LIGHT_GRAY = (150, 150, 150)
+# The orb colors (COLORS, and the GREEN ... YELLOW used here) are imported from simulation with the game rules
+
+# --- Rendering Options ---
+SKIN = "rounded" # Cannon and sprite art: "rounded", "trimmed", "faceted" or "line" (see skins.py); also in Settings
+LAUNCHER_ANGLE_STEP = 1.0 # Degrees between pre-rotated launcher frames (e.g. 1.0 or 0.5)
+LAUNCHER_LAZY_ROTATION = False # Only rotate launcher frames the first time they are needed
+LAUNCHER_CACHE_MB = 64 # Memory for one skin's launcher frames; a step that does not fit is widened with a warning
+DIRTY_RENDERING = False # Only repaint the parts of the screen that changed while playing
+PLAYING_BACKGROUND = None # Stars while playing: "parallax" (scrolling layers), "static" or None (plain black)
+STARFIELD_STARS = 150 # Stars in the menu starfields and the playing background
+
+# --- Simulation Options ---
+TICK_RATE = 60 # Game logic ticks per second, independent of the frame rate
+UNCAPPED_FRAME_RATE = False # Render as fast as possible while playing; logic stays at TICK_RATE
+INTERPOLATE_RENDERING = True # Draw sprites between the last two ticks for smooth motion
+NUMPY_ORB_ENGINE = False # Advance all orbs in one vectorized NumPy step (for stress levels)
+NEXT_COLOR_WEIGHTED = False # Pick the next projectile color by how many orbs of it are left
+RECORD_REPLAY = None # File to save an input replay of the session to (see replay.py), e.g. "session.omr"
+REWIND_SECONDS = 30 # Seconds of play kept for rewinding (R, then LEFT/RIGHT); 0 turns it off. Off while recording
+REWIND_SCRUB_SPEED = 2 # Ticks moved per frame while LEFT/RIGHT is held in rewind
+PROFILE_FRAMES = False # Time each phase of the playing frame; F3 shows p50/p95/p99 per phase on screen
+PROFILE_EXPORT = None # File to write the frame timings to after each level and at quit, "frames.csv" or "frames.json"
+REPORT_STARTUP = False # Print how long each startup step took, once the title screen is up
+REPORT_MENU_CPU = False # Print how much CPU the menus used while waiting for input, at quit
+REPORT_LAUNCHER_CACHE = False # Print how many launcher frames were rotated and the memory they take, at quit
+SESSION_SEED = None # Seed for a reproducible session (levels, next colors, starfields); None picks a new one
+COLLISION_BACKEND = "rects" # "rects" (pygame groupcollide), "rings" (ring/sector buckets), "grid" (spatial hash)
+                            # or "swept" (continuous, for fast shots); "rings" and "swept" follow Orb.angle,
+                            # so they do not combine with NUMPY_ORB_ENGINE
+
+# --- Initialization ---
+# Only the display comes up at launch: fonts load when first drawn and the mixer when the volume is set
+startup.timer.mark("imports")
+pygame.display.init()
+screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+pygame.display.set_caption("Orbital Match")
+# Show the window before anything else is loaded
+screen.fill(BLACK)
+pygame.display.flip()
+startup.timer.mark("window")
+clock = pygame.time.Clock()
+dirty_renderer = DirtyRenderer(screen, BLACK)
+menu_meter = CpuMeter() if REPORT_MENU_CPU else None
+
+# --- Fonts ---
+font_lg = LazyFont(None, 80)
+font_md = LazyFont(None, 50)
+font_sm = LazyFont(None, 36)
+font_tiny = LazyFont(None, 24)
+
+# --- Cached HUD Text ---
+text_cache = TextCache()
+score_digits = DigitRenderer(font_sm, WHITE, prefix="Score: ")
+combo_digits = DigitRenderer(font_sm, YELLOW, prefix="Combo: ", suffix="x")
+
+# --- Global Variables for Settings ---
+volume = 0.5 # Initial volume level (0.0 to 1.0)
+
+def set_music_volume(level):
+    # The mixer opens the audio device, so it is only started once there is a volume to set
+    if not pygame.mixer.get_init():
+        pygame.mixer.init()
+    pygame.mixer.music.set_volume(level)
+
+# --- Classes ---
+class Launcher(pygame.sprite.Sprite):
+    """
+    The player's launcher in the center of the screen, drawn in the current skin.
+    """
+    # Pre-rotated cannon frames by skin name; each cannon is drawn and rotated once, then shared by every launcher.
+    # select_skin() drops the frames of the other skins, so only one skin's frames are held at a time
+    # (and launchers made before a skin change are not drawn again)
+    frames = {}
+
+    def __init__(self):
+        super().__init__()
+        self.skin = current_skin
+        self.image = pygame.Surface([100, 100], pygame.SRCALPHA)
+        if self.skin.hub_radius:
+            pygame.draw.circle(self.image, WHITE, (50, 50), self.skin.hub_radius)
+        self.rect = self.image.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
+        self.angle = 0
+        # Mouse position the angle was taken from; until the first update, a point straight ahead
+        self.aim_pos = (self.rect.centerx + 1, self.rect.centery)
+        if self.skin.cannon is not None and self.skin.name not in Launcher.frames:
+            Launcher.frames[self.skin.name] = RotationCache(self.skin.cannon(), LAUNCHER_ANGLE_STEP,
+                                                            LAUNCHER_LAZY_ROTATION, LAUNCHER_CACHE_MB * 1024 * 1024)
+    
+    def update(self):
+        # Aim at the mouse position
+        mouse_x, mouse_y = pygame.mouse.get_pos()
+        self.aim_pos = (mouse_x, mouse_y)
+        dx = mouse_x - self.rect.centerx
+        dy = mouse_y - self.rect.centery
+        self.angle = math.atan2(dy, dx)
+        
+    def draw(self, surface):
+        # Returns the area drawn so the dirty renderer can erase it next frame
+        if self.skin.cannon is None:
+            # Draw a line showing the aim direction
+            end_x = self.rect.centerx + math.cos(self.angle) * 100
+            end_y = self.rect.centery + math.sin(self.angle) * 100
+            drawn_rect = pygame.draw.line(surface, LIGHT_GRAY, self.rect.center, (end_x, end_y), 3)
+        else:
+            # Look up the pre-rotated cannon frame nearest to the aim angle (in degrees)
+            rotated_cannon, rotated_rect = Launcher.frames[self.skin.name].place(-math.degrees(self.angle),
+                                                                                 self.rect.center)
+            surface.blit(rotated_cannon, rotated_rect)
+            
+            # Draw the loading base
+            base_width = 80
+            base_height = 40
+            base_rect = pygame.Rect(self.rect.centerx - base_width/2, self.rect.centery + 10, base_width, base_height)
+            drawn_rect = rotated_rect.union(pygame.draw.ellipse(surface, (100, 100, 100), base_rect))
+        if self.skin.hub_radius:
+            drawn_rect = drawn_rect.union(surface.blit(self.image, self.rect))
+        return drawn_rect
+
+class Orb(simulation.Orb):
+    """
+    An orb as drawn on screen; movement and rules come from simulation.Orb.
+    """
+    def __init__(self, color, radius, angle, speed, center):
+        super().__init__(color, radius, angle, speed, center)
+        # All orbs of a color share one pre-drawn surface from the atlas
+        self.image = sprite_atlas.get("orb", self.color)
+
+class Projectile(simulation.Projectile):
+    """
+    A projectile as drawn on screen; flight comes from simulation.Projectile.
+    """
+    def __init__(self, x, y, color, angle, speed=simulation.PROJECTILE_SPEED):
+        super().__init__(x, y, color, angle, speed)
+        # All projectiles of a color share one pre-drawn surface from the atlas
+        self.image = sprite_atlas.get("projectile", self.color)
+        
+# --- Drawing functions ---
+# The orb, projectile and cannon art come from the skins in skins.py
+def create_heart_icon():
+    surface = pygame.Surface([30, 30], pygame.SRCALPHA)
+    pygame.draw.polygon(surface, RED, [
+        (15, 0), (10, 5), (0, 15), (0, 25), (5, 30),
+        (15, 25), (25, 30), (30, 25), (30, 15), (20, 5)
+    ])
+    return surface
+
+def create_swatch_icon(color):
+    surface = pygame.Surface([20, 20], pygame.SRCALPHA)
+    pygame.draw.circle(surface, color, (10, 10), 10)
+    return surface
+
+# --- Shared sprite atlas ---
+sprite_atlas = SpriteAtlas()
+current_skin = None
+
+def select_skin(name):
+    # Switches the launcher and sprite art; launchers made afterwards use the new skin
+    global current_skin
+    if name not in SKINS:
+        raise ValueError(f"unknown skin {name!r}; use one of {', '.join(SKINS)}")
+    current_skin = SKINS[name]
+    # Frames of the other skins are rotated again if they are picked again
+    Launcher.frames = {skin_name: frames for skin_name, frames in Launcher.frames.items() if skin_name == name}
+    # Re-registering a kind drops the surfaces drawn in the previous skin
+    sprite_atlas.register("orb", current_skin.orb, (30, 30))
+    sprite_atlas.register("projectile", current_skin.projectile, (20, 20))
+
+select_skin(SKIN)
+
+# --- HUD Icons ---
+hud_icons = IconSet()
+hud_icons.add("heart", create_heart_icon())
+for color in COLORS:
+    hud_icons.add(("next", color), create_swatch_icon(color))
+startup.timer.mark("sprites and icons")
+
+# --- Menu Screens ---
+# Menus wait for input in run_screen() and only redraw when something changed.
+# Closing the window on any of them raises QuitRequested, which run_game_loop() turns into a normal quit
+class SettingsScreen(Screen):
+    """
+    Volume slider, a way to the instructions, the skin choice and a back button.
+    """
+    def __init__(self):
+        super().__init__()
+        # Volume slider
+        self.slider_rect = pygame.Rect(SCREEN_WIDTH // 2 - 150, SCREEN_HEIGHT // 2, 300, 20)
+        self.slider_knob_rect = pygame.Rect(self.slider_rect.x + (self.slider_rect.width * volume) - 10,
+                                            self.slider_rect.y - 5, 20, 30)
+        # Instructions button
+        self.instructions_button = pygame.Rect(SCREEN_WIDTH // 2 - 125, SCREEN_HEIGHT // 2 + 80, 250, 60)
+        # Skin button, cycles through the registered skins
+        self.skin_button = pygame.Rect(SCREEN_WIDTH // 2 - 125, SCREEN_HEIGHT // 2 + 160, 250, 60)
+        # Back button
+        self.back_button = pygame.Rect(SCREEN_WIDTH // 2 - 75, SCREEN_HEIGHT - 100, 150, 50)
+        self.dragging_knob = False
+
+    def handle_event(self, event):
+        global volume
+        if event.type == pygame.MOUSEBUTTONDOWN:
+            if self.slider_knob_rect.collidepoint(event.pos):
+                self.dragging_knob = True
+            if self.back_button.collidepoint(event.pos):
+                self.close()
+            elif self.instructions_button.collidepoint(event.pos):
+                show_instructions()
+                self.dirty = True
+            elif self.skin_button.collidepoint(event.pos):
+                names = list(SKINS)
+                select_skin(names[(names.index(current_skin.name) + 1) % len(names)])
+                self.dirty = True
+        if event.type == pygame.MOUSEBUTTONUP:
+            self.dragging_knob = False
+        if event.type == pygame.MOUSEMOTION and self.dragging_knob:
+            mouse_x, _ = event.pos
+            if self.slider_rect.left <= mouse_x <= self.slider_rect.right:
+                knob_pos = mouse_x - self.slider_rect.left
+                volume = knob_pos / self.slider_rect.width
+                self.slider_knob_rect.centerx = mouse_x
+                set_music_volume(volume)
+                self.dirty = True
+
+    def draw(self, surface):
+        surface.fill(BLACK)
+        
+        # Draw settings title
+        title_text = text_cache.render(font_md, "Settings", WHITE)
+        title_rect = title_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 4))
+        surface.blit(title_text, title_rect)
+
+        # Draw volume slider
+        volume_text = text_cache.render(font_sm, f"Volume: {int(volume * 100)}%", WHITE)
+        volume_rect = volume_text.get_rect(center=(SCREEN_WIDTH // 2, self.slider_rect.y - 30))
+        surface.blit(volume_text, volume_rect)
+        pygame.draw.rect(surface, GRAY, self.slider_rect, border_radius=10)
+        pygame.draw.rect(surface, CYAN, self.slider_knob_rect, border_radius=5)
+        
+        # Draw instructions button
+        pygame.draw.rect(surface, LIGHT_GRAY, self.instructions_button, border_radius=20)
+        instructions_text = text_cache.render(font_sm, "How to Play", BLACK)
+        surface.blit(instructions_text, instructions_text.get_rect(center=self.instructions_button.center))
+        
+        # Draw skin button
+        pygame.draw.rect(surface, LIGHT_GRAY, self.skin_button, border_radius=20)
+        skin_text = text_cache.render(font_sm, f"Cannon: {current_skin.label}", BLACK)
+        surface.blit(skin_text, skin_text.get_rect(center=self.skin_button.center))
+        
+        # Draw back button
+        pygame.draw.rect(surface, GRAY, self.back_button, border_radius=15)
+        back_text = text_cache.render(font_sm, "Back", WHITE)
+        surface.blit(back_text, back_text.get_rect(center=self.back_button.center))
+
+class TitleScreen(Screen):
+    """
+    Title and difficulty buttons over a starfield; closes with the chosen
+    difficulty, or None after visiting the instructions or settings.
+    """
+    def __init__(self, starfield):
+        super().__init__()
+        self.starfield = starfield
+        self.earth_button = pygame.Rect(SCREEN_WIDTH // 2 - 125, SCREEN_HEIGHT // 2, 250, 60)
+        self.mars_button = pygame.Rect(SCREEN_WIDTH // 2 - 125, SCREEN_HEIGHT // 2 + 80, 250, 60)
+        self.neptune_button = pygame.Rect(SCREEN_WIDTH // 2 - 125, SCREEN_HEIGHT // 2 + 160, 250, 60)
+        self.instructions_button = pygame.Rect(SCREEN_WIDTH // 2 - 125, SCREEN_HEIGHT // 2 + 240, 250, 60)
+        self.settings_button = pygame.Rect(SCREEN_WIDTH // 2 - 125, SCREEN_HEIGHT // 2 + 320, 250, 60)
+
+    def shown(self):
+        # The first title frame ends the startup
+        if startup.timer.finish("title screen") and REPORT_STARTUP:
+            print(startup.timer.report())
+
+    def handle_event(self, event):
+        if event.type == pygame.MOUSEBUTTONDOWN:
+            if self.earth_button.collidepoint(event.pos): self.close("easy")
+            elif self.mars_button.collidepoint(event.pos): self.close("medium")
+            elif self.neptune_button.collidepoint(event.pos): self.close("hard")
+            elif self.settings_button.collidepoint(event.pos):
+                show_settings_screen()
+                self.close()
+            elif self.instructions_button.collidepoint(event.pos):
+                show_instructions()
+                self.close()
+
+    def draw(self, surface):
+        # Draw the starfield background; it also clears the screen
+        self.starfield.draw(surface)
+
+        # Draw title
+        title_text = text_cache.render(font_lg, "Orbital Match", WHITE)
+        title_rect = title_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 4))
+        surface.blit(title_text, title_rect)
+
+        # Draw the buttons
+        pygame.draw.rect(surface, GREEN, self.earth_button, border_radius=20)
+        pygame.draw.rect(surface, RED, self.mars_button, border_radius=20)
+        pygame.draw.rect(surface, BLUE, self.neptune_button, border_radius=20)
+        pygame.draw.rect(surface, LIGHT_GRAY, self.instructions_button, border_radius=20)
+        pygame.draw.rect(surface, GRAY, self.settings_button, border_radius=20)
+        
+        # Add text to buttons
+        for label, button in [("Earth (Easy)", self.earth_button), ("Mars (Medium)", self.mars_button),
+                              ("Neptune (Hard)", self.neptune_button), ("Instructions", self.instructions_button),
+                              ("Settings", self.settings_button)]:
+            label_text = text_cache.render(font_sm, label, BLACK)
+            surface.blit(label_text, label_text.get_rect(center=button.center))
+
+class InstructionsScreen(Screen):
+    """
+    How to play, with a back button.
+    """
+    lines = [
+        "Objective: Clear the screen by launching projectiles at orbiting orbs.",
+        "",
+        "Controls:",
+        "- Use the mouse to aim the central launcher.",
+        "- Click the LEFT mouse button to fire a projectile.",
+        "- Press R to rewind, LEFT/RIGHT to scrub, R or click to play on.",
+        "",
+        "Rules:",
+        "- The projectile must have the SAME color as the orb it hits.",
+        "- A successful match removes both the projectile and the orb.",
+        "- Hitting an incorrect color or missing an orb will cost you a life!",
+        "",
+        "Difficulty Levels:",
+        "- Earth (Easy): Slower orbits and fewer colors.",
+        "- Mars (Medium): Increased speeds and orb count.",
+        "- Neptune (Hard): Fast, dense orbits and more colors to match."
+    ]
+
+    def __init__(self):
+        super().__init__()
+        self.back_button = pygame.Rect(SCREEN_WIDTH // 2 - 75, SCREEN_HEIGHT - 100, 150, 50)
+
+    def handle_event(self, event):
+        if event.type == pygame.MOUSEBUTTONDOWN:
+            if self.back_button.collidepoint(event.pos): self.close()
+
+    def draw(self, surface):
+        surface.fill(BLACK)
+        
+        title_text = text_cache.render(font_md, "How to Play", WHITE)
+        surface.blit(title_text, title_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 4)))
+        
+        y_offset = SCREEN_HEIGHT // 3 - 20
+        for line in self.lines:
+            line_text = text_cache.render(font_tiny, line, WHITE)
+            line_rect = line_text.get_rect(center=(SCREEN_WIDTH // 2, y_offset))
+            surface.blit(line_text, line_rect)
+            y_offset += 25
+        
+        pygame.draw.rect(surface, LIGHT_GRAY, self.back_button, border_radius=15)
+        back_text = text_cache.render(font_sm, "Back", BLACK)
+        surface.blit(back_text, back_text.get_rect(center=self.back_button.center))
+
+class EndScreen(Screen):
+    """
+    Level result and final score over a starfield; any click closes it.
+    """
+    def __init__(self, message, score, starfield):
+        super().__init__()
+        self.message = message
+        self.score = score
+        # Draw a starfield background on the end screen as well
+        self.starfield = starfield
+
+    def handle_event(self, event):
+        if event.type == pygame.MOUSEBUTTONDOWN:
+            self.close()
+
+    def draw(self, surface):
+        self.starfield.draw(surface)
+
+        end_text = font_lg.render(self.message, True, WHITE)
+        final_score_text = font_md.render(f"Final Score: {self.score}", True, WHITE)
+        restart_text = text_cache.render(font_sm, "Click to play again", WHITE)
+        
+        surface.blit(end_text, end_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 70)))
+        surface.blit(final_score_text, final_score_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2)))
+        surface.blit(restart_text, restart_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 70)))
+
+def show_settings_screen():
+    run_screen(SettingsScreen(), screen, menu_meter)
+
+def show_title_screen(starfield):
+    return run_screen(TitleScreen(starfield), screen, menu_meter)
+
+def show_instructions():
+    run_screen(InstructionsScreen(), screen, menu_meter)
+
+def show_end_screen(message, score, starfield):
+    run_screen(EndScreen(message, score, starfield), screen, menu_meter)
+
+def draw_hud(surface, score, lives, combo_count, next_projectile_color):
+    # Returns the rects drawn so the dirty renderer can erase them next frame
+    drawn_rects = []
+
+    # The score is composed from pre-rendered digits instead of re-rendering the text
+    drawn_rects.append(score_digits.draw(surface, score, (10, 10)))
+
+    # Icons and fixed labels are pre-rendered and drawn in one batched blit
+    icon_blits = []
+    if lives > 0:
+        icon_blits.append((hud_icons.row("heart", lives, 40), (10, 50)))
+    
+    if combo_count > 0:
+        combo_x = SCREEN_WIDTH // 2 - combo_digits.width(combo_count) // 2
+        drawn_rects.append(combo_digits.draw(surface, combo_count, (combo_x, 10)))
+
+    next_color_text = text_cache.render(font_tiny, "Next:", WHITE)
+    icon_blits.append((next_color_text, (SCREEN_WIDTH - 120, 10)))
+    if next_projectile_color:
+        icon_blits.append((hud_icons.get(("next", next_projectile_color)), (SCREEN_WIDTH - 60, 15)))
+    drawn_rects.extend(surface.blits(icon_blits))
+
+    return drawn_rects
+
+def run_game_loop():
+    running = True
+    # Launcher scripts set SKIN after importing this module
+    select_skin(SKIN)
+    # The rules run in a headless Game; this loop only feeds it input and draws it
+    game = Game(SCREEN_WIDTH, SCREEN_HEIGHT, orb_class=Orb, projectile_class=Projectile,
+                collision_backend=COLLISION_BACKEND, numpy_orb_engine=NUMPY_ORB_ENGINE,
+                next_color_weighted=NEXT_COLOR_WEIGHTED, seed=SESSION_SEED)
+    # Set SESSION_SEED to this value to play the same session again
+    print(f"Session seed: {game.seed}")
+    # Starfields get their own stream, so browsing the menus does not change the levels
+    starfield_rng = random.Random(f"{game.seed}/starfield")
+    # Each starfield is rendered once and reused every time its screen is shown
+    title_starfield = Starfield((SCREEN_WIDTH, SCREEN_HEIGHT), STARFIELD_STARS, starfield_rng)
+    end_starfield = None # Rendered when the first level ends
+    playing_background = None # Rendered when the first level starts
+    # A scrolling background changes every pixel each frame, which leaves dirty rendering nothing to save
+    dirty_rendering = DIRTY_RENDERING and PLAYING_BACKGROUND != "parallax"
+    recorder = None
+    if RECORD_REPLAY:
+        recorder = InputRecorder(game.seed, game.collision_backend, game.numpy_orb_engine, game.next_color_weighted)
+    # A replay has no way to express a rewind, so the two do not mix
+    rewind = RewindBuffer(REWIND_SECONDS * TICK_RATE) if REWIND_SECONDS and recorder is None else None
+    rewind_position = None # Held tick shown while rewinding; None while playing
+    profiler = FrameProfiler() if PROFILE_FRAMES or PROFILE_EXPORT else None
+    game.profiler = profiler
+    show_profile = False
+    game_state = "title"
+    timestep = FixedTimestep(TICK_RATE)
+    frame_seconds = 0.0
+
+    while running:
+        if game_state == "title":
+            try:
+                difficulty = show_title_screen(title_starfield)
+            except QuitRequested:
+                running = False
+                continue
+            if difficulty == None:
+                continue
+            
+            # Set up level layout
+            game.setup_level(difficulty)
+            if recorder is not None:
+                recorder.level(difficulty)
+            if rewind is not None:
+                rewind.clear()
+            
+            # Draw every orb and projectile color once before the level starts
+            level_colors = COLORS[:game.available_colors]
+            sprite_atlas.prebuild("orb", level_colors)
+            sprite_atlas.prebuild("projectile", level_colors)
+            if playing_background is None and PLAYING_BACKGROUND is not None:
+                playing_background = make_background(PLAYING_BACKGROUND, (SCREEN_WIDTH, SCREEN_HEIGHT),
+                                                     STARFIELD_STARS, starfield_rng)
+                if dirty_rendering:
+                    dirty_renderer.set_background(playing_background.surface)
+
+            launcher = Launcher()
+            all_sprites = pygame.sprite.RenderUpdates(launcher, game.orbs)
+            
+            game_state = game.state
+            dirty_renderer.reset()
+            # Time spent on the title screen is not game time
+            timestep.reset()
+            clock.tick()
+            
+        elif game_state == "playing":
+            if profiler is not None:
+                profiler.begin_frame()
+
+            # --- Event Handling ---
+            resume = False
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    running = False
+                if event.type == pygame.KEYDOWN and event.key == pygame.K_F3 and profiler is not None:
+                    show_profile = not show_profile
+                if event.type == pygame.KEYDOWN and event.key == pygame.K_r and rewind is not None:
+                    if rewind_position is not None:
+                        resume = True
+                    elif len(rewind):
+                        # Pause on the latest tick; LEFT/RIGHT then move through the history
+                        rewind_position = len(rewind) - 1
+                if event.type == pygame.MOUSEBUTTONDOWN:
+                    if rewind_position is not None:
+                        resume = True
+                    elif event.button == 1:
+                        if recorder is not None:
+                            recorder.fire(launcher.aim_pos)
+                        new_projectile = game.fire(launcher.angle)
+                        if new_projectile is not None:
+                            all_sprites.add(new_projectile)
+                            if rewind is not None:
+                                rewind.fire(launcher.angle)
+            if profiler is not None:
+                profiler.mark("events")
+
+            # --- Rewind ---
+            if rewind_position is not None:
+                keys = pygame.key.get_pressed()
+                position = rewind_position + (keys[pygame.K_RIGHT] - keys[pygame.K_LEFT]) * REWIND_SCRUB_SPEED
+                position = max(0, min(position, len(rewind) - 1))
+                if position != rewind_position:
+                    rewind_position = position
+                    rewind.restore(game, rewind_position)
+                    # The restored orbs and projectiles are new sprites
+                    all_sprites = pygame.sprite.RenderUpdates(launcher, game.orbs, game.projectiles)
+                    dirty_renderer.reset()
+                    timestep.reset()
+                if resume:
+                    # Play on from the shown tick; the ticks after it are forgotten
+                    rewind.truncate(rewind_position + 1)
+                    rewind_position = None
+                    timestep.reset()
+                    frame_seconds = 0.0
+            if profiler is not None:
+                profiler.mark("rewind")
+            
+            # --- Game Logic ---
+            # Logic runs in fixed ticks, however long the last frame took; none while rewinding
+            logic_ticks = 0 if rewind_position is not None else timestep.advance(frame_seconds)
+            for tick in range(logic_ticks):
+                if INTERPOLATE_RENDERING and tick == logic_ticks - 1:
+                    # Only the positions before the last tick are drawn from, so only those are captured
+                    game.sync_rects()
+                    timestep.capture(all_sprites)
+                launcher.update()
+                if recorder is not None:
+                    recorder.tick(launcher.aim_pos)
+                if profiler is not None:
+                    profiler.mark("logic")
+                game.step()
+                if rewind is not None:
+                    rewind.record(game)
+                game_state = game.state
+                if game_state != "playing":
+                    if recorder is not None:
+                        # Saved after every level, since quitting from a menu exits right away
+                        recorder.save(RECORD_REPLAY)
+                    if PROFILE_EXPORT:
+                        profiler.export(PROFILE_EXPORT)
+                    break
+            if profiler is not None:
+                profiler.mark("logic")
+            
+            # --- Rendering ---
+            game.sync_rects()
+            if dirty_rendering:
+                dirty_renderer.clear(all_sprites)
+            elif playing_background is not None:
+                # Replaces the fill with one blit per layer, however many stars there are
+                playing_background.update(frame_seconds)
+                playing_background.draw(screen)
+            else:
+                screen.fill(BLACK)
+            
+            drawn_rects = [launcher.draw(screen)]
+            if INTERPOLATE_RENDERING:
+                # Draw sprites between the last two ticks so motion stays smooth
+                with timestep.interpolated(all_sprites):
+                    sprite_rects = all_sprites.draw(screen)
+            else:
+                sprite_rects = all_sprites.draw(screen)
+            drawn_rects.extend(draw_hud(screen, game.score, game.lives, game.combo_count, game.next_projectile_color))
+            if rewind_position is not None:
+                seconds_back = (len(rewind) - 1 - rewind_position) / TICK_RATE
+                rewind_text = text_cache.render(font_sm, f"Rewind -{seconds_back:.1f} s", YELLOW)
+                drawn_rects.append(screen.blit(rewind_text, rewind_text.get_rect(midtop=(SCREEN_WIDTH // 2, 50))))
+            if show_profile:
+                drawn_rects.extend(profiler.draw_overlay(screen, font_tiny, WHITE, (10, SCREEN_HEIGHT - 190)))
+            if profiler is not None:
+                profiler.mark("render")
+            
+            if dirty_rendering:
+                dirty_renderer.present(sprite_rects, drawn_rects)
+            else:
+                pygame.display.flip()
+            if profiler is not None:
+                profiler.mark("present")
+                profiler.end_frame()
+        
+        elif game_state in ("win", "game_over"):
+            if end_starfield is None:
+                end_starfield = Starfield((SCREEN_WIDTH, SCREEN_HEIGHT), STARFIELD_STARS, starfield_rng)
+            message = "Level Complete!" if game_state == "win" else "Game Over"
+            try:
+                show_end_screen(message, game.score, end_starfield)
+            except QuitRequested:
+                running = False
+                continue
+            game_state = "title"
+
+        # --- Frame Rate Control ---
+        if UNCAPPED_FRAME_RATE and game_state == "playing":
+            frame_seconds = clock.tick() / 1000
+        else:
+            frame_seconds = clock.tick(FPS) / 1000
+
+    if recorder is not None:
+        recorder.save(RECORD_REPLAY)
+    if PROFILE_EXPORT:
+        profiler.export(PROFILE_EXPORT)
+    if menu_meter is not None:
+        print(menu_meter.report())
+    if REPORT_LAUNCHER_CACHE:
+        for name, frames in Launcher.frames.items():
+            print(f"Launcher frames ({name}): {frames.report()}")
+    pygame.quit()
+
+if __name__ == "__main__":
+    run_game_loop()
\ No newline at end of file
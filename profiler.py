@@ -0,0 +1,109 @@
+import time
+from array import array
+
+# Phases of a playing frame, in the order they run
+FRAME_PHASES = ["events", "rewind", "logic", "movement", "cull", "collisions", "render", "present"]
+SUMMARY_FIELDS = ["phase", "samples", "mean_ms", "p50_ms", "p95_ms", "p99_ms", "max_ms"]
+
+def percentile(sorted_values, fraction):
+    # Nearest-rank percentile of an already sorted sequence
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, round(fraction * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+class FrameProfiler:
+    """
+    Per-phase timings of the playing frame over the last window frames.
+
+    The frame calls begin_frame(), then mark(phase) at the end of every
+    phase, which charges the time since the previous mark to that phase; a
+    phase marked more than once in a frame (one per logic tick) adds up.
+    end_frame() stores each phase's total for the frame, plus the whole
+    frame, in a fixed-size ring buffer, so memory stays the same however
+    long the session runs. Frontends keep the profiler as None when it is
+    off, which leaves a single "is not None" test per phase.
+    """
+    def __init__(self, window=600, phases=FRAME_PHASES, overlay_interval=30):
+        self.window = window
+        self.phases = list(phases) + ["frame"]
+        self.samples = {phase: array("d", bytes(8 * window)) for phase in self.phases}
+        self.current = dict.fromkeys(self.phases, 0.0)
+        self.index = 0
+        self.frames = 0
+        self.frame_start = 0.0
+        self.last_mark = 0.0
+        # The overlay text only changes every overlay_interval frames
+        self.overlay_interval = overlay_interval
+        self.overlay_lines = None
+
+    def begin_frame(self):
+        self.frame_start = self.last_mark = time.perf_counter()
+
+    def mark(self, phase):
+        now = time.perf_counter()
+        self.current[phase] += now - self.last_mark
+        self.last_mark = now
+
+    def end_frame(self):
+        current = self.current
+        current["frame"] = self.last_mark - self.frame_start
+        index = self.index
+        for phase, seconds in current.items():
+            self.samples[phase][index] = seconds * 1000
+            current[phase] = 0.0
+        self.index = (index + 1) % self.window
+        self.frames += 1
+        if self.frames % self.overlay_interval == 0:
+            self.overlay_lines = None
+
+    def summary(self):
+        # {phase: {samples, mean_ms, p50_ms, p95_ms, p99_ms, max_ms}} over the frames held
+        count = min(self.frames, self.window)
+        result = {}
+        for phase in self.phases:
+            values = sorted(self.samples[phase][:count])
+            result[phase] = {
+                "samples": count,
+                "mean_ms": sum(values) / count if count else 0.0,
+                "p50_ms": percentile(values, 0.50),
+                "p95_ms": percentile(values, 0.95),
+                "p99_ms": percentile(values, 0.99),
+                "max_ms": values[-1] if values else 0.0,
+            }
+        return result
+
+    def export(self, path):
+        # Writes the summary as JSON for a .json path, CSV otherwise
+        # (imported here, so the game does not load them at startup when not profiling)
+        import csv
+        import json
+        summary = self.summary()
+        if path.endswith(".json"):
+            with open(path, "w") as file:
+                json.dump({"window": self.window, "frames": self.frames, "phases": summary}, file, indent=2)
+            return
+        with open(path, "w", newline="") as file:
+            writer = csv.writer(file)
+            writer.writerow(SUMMARY_FIELDS)
+            for phase, stats in summary.items():
+                writer.writerow([phase] + [round(stats[field], 4) if field != "samples" else stats[field]
+                                           for field in SUMMARY_FIELDS[1:]])
+
+    def draw_overlay(self, surface, font, color, topleft, column_width=60):
+        # Draws p50/p95/p99 per phase as a table and returns the rects drawn
+        if self.overlay_lines is None:
+            rows = [("ms", "p50", "p95", "p99")]
+            for phase, stats in self.summary().items():
+                rows.append((phase, f"{stats['p50_ms']:.2f}", f"{stats['p95_ms']:.2f}", f"{stats['p99_ms']:.2f}"))
+            self.overlay_lines = [[font.render(cell, True, color) for cell in row] for row in rows]
+        x, y = topleft
+        label_width = 2 * column_width
+        blits = []
+        for row in self.overlay_lines:
+            blits.append((row[0], (x, y)))
+            for column, cell in enumerate(row[1:], 1):
+                # Numbers are right-aligned in their column
+                blits.append((cell, (x + label_width + column * column_width - cell.get_width(), y)))
+            y += row[0].get_height()
+        return surface.blits(blits)
@@ -0,0 +1,256 @@
+"""
+Input replays: record what the player did in a session and play it back.
+
+Only the inputs run_game_loop acts on are kept: the mouse position the
+launcher aims at, left clicks, and which difficulty each level was started
+on, plus the session seed and the Game options that change how it plays
+out (collision backend, NumPy orb engine, weighted next colors). Records
+are delta encoded as varints (a run of unchanged ticks costs nothing) and
+the stream is zlib compressed. Played back on a Game with the same seed
+and options, the session unfolds tick for tick as it was played.
+
+    python replay.py session.omr [--render] [--fps 0] [--skin rounded]
+"""
+import math
+import struct
+import sys
+import time
+import zlib
+
+import pygame
+from simulation import DIFFICULTY_PRESETS, Game
+
+MAGIC = b"OMRP"
+VERSION = 2
+HEADER = struct.Struct("<4sBQBB") # magic, version, seed, collision backend index, option flags
+COLLISION_BACKENDS = ["rects", "rings", "grid", "swept"]
+
+# --- Option Flags ---
+NUMPY_ORB_ENGINE = 1
+NEXT_COLOR_WEIGHTED = 2
+
+# --- Record Kinds ---
+MOVE = 0 # Mouse moved; followed by the x and y change
+FIRE = 1 # Left click; followed by the x and y change to the exact aim of the shot
+LEVEL = 2 # Level started; followed by the difficulty index
+END = 3 # Session over
+DIFFICULTIES = list(DIFFICULTY_PRESETS)
+
+def write_varint(out, value):
+    while value > 0x7F:
+        out.append(value & 0x7F | 0x80)
+        value >>= 7
+    out.append(value)
+
+def read_varint(data, offset):
+    value = 0
+    shift = 0
+    while True:
+        byte = data[offset]
+        offset += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, offset
+        shift += 7
+
+def zigzag(value):
+    # Small negative and positive changes both become small varints
+    return value * 2 if value >= 0 else -value * 2 - 1
+
+def unzigzag(value):
+    return value >> 1 if value % 2 == 0 else -(value >> 1) - 1
+
+class InputRecorder:
+    """
+    Collects a session's inputs while it is played.
+
+    run_game_loop calls level() when a level starts, fire() for every left
+    click and tick() once per logic tick with the mouse position. Every
+    record starts with how many ticks passed since the previous one, so
+    ticks where nothing changed are not stored at all.
+
+    Only the aim of each shot has to be exact for the game to play out the
+    same, so each FIRE carries it, while mouse moves in between are kept at
+    most every aim_interval ticks for drawing the launcher on playback.
+    aim_interval=1 keeps every tick's position.
+    The Game options are stored with the seed, since they change the results.
+    """
+    def __init__(self, seed, collision_backend="rects", numpy_orb_engine=False, next_color_weighted=False,
+                 aim_interval=4):
+        self.seed = seed
+        self.collision_backend = collision_backend
+        self.numpy_orb_engine = numpy_orb_engine
+        self.next_color_weighted = next_color_weighted
+        self.aim_interval = aim_interval
+        self.body = bytearray()
+        self.pending_ticks = 0
+        self.ticks_since_move = 0
+        self.mouse_pos = (0, 0) # Last position written
+        self.aim_pos = (0, 0) # Position the launcher aims at now
+
+    def _record(self, kind):
+        write_varint(self.body, self.pending_ticks << 2 | kind)
+        self.pending_ticks = 0
+
+    def _write_aim(self):
+        write_varint(self.body, zigzag(self.aim_pos[0] - self.mouse_pos[0]))
+        write_varint(self.body, zigzag(self.aim_pos[1] - self.mouse_pos[1]))
+        self.mouse_pos = self.aim_pos
+        self.ticks_since_move = 0
+
+    def level(self, difficulty):
+        self._record(LEVEL)
+        self.body.append(DIFFICULTIES.index(difficulty))
+
+    def fire(self, aim_pos):
+        # aim_pos is the mouse position the launcher was aiming at for this shot
+        self.aim_pos = aim_pos
+        self._record(FIRE)
+        self._write_aim()
+
+    def tick(self, mouse_pos):
+        # Called before the tick's step, with the position Launcher.update aimed at
+        self.aim_pos = mouse_pos
+        self.ticks_since_move += 1
+        if mouse_pos != self.mouse_pos and self.ticks_since_move >= self.aim_interval:
+            self._record(MOVE)
+            self._write_aim()
+        self.pending_ticks += 1
+
+    def to_bytes(self):
+        body = bytearray(self.body)
+        write_varint(body, self.pending_ticks << 2 | END)
+        flags = (NUMPY_ORB_ENGINE if self.numpy_orb_engine else 0) | \
+            (NEXT_COLOR_WEIGHTED if self.next_color_weighted else 0)
+        header = HEADER.pack(MAGIC, VERSION, self.seed, COLLISION_BACKENDS.index(self.collision_backend), flags)
+        return header + zlib.compress(bytes(body), 9)
+
+    def save(self, path):
+        with open(path, "wb") as file:
+            file.write(self.to_bytes())
+
+class Replay:
+    """
+    A recorded session, decoded into (ticks_before, kind, value) records.
+    """
+    def __init__(self, data):
+        magic, version = data[:4], data[4]
+        if magic != MAGIC:
+            raise ValueError("not an Orbital Match replay")
+        if version != VERSION:
+            raise ValueError(f"unsupported replay version {version}")
+        _, _, self.seed, backend, flags = HEADER.unpack_from(data)
+        self.collision_backend = COLLISION_BACKENDS[backend]
+        self.numpy_orb_engine = bool(flags & NUMPY_ORB_ENGINE)
+        self.next_color_weighted = bool(flags & NEXT_COLOR_WEIGHTED)
+        body = zlib.decompress(data[HEADER.size:])
+        self.records = []
+        offset = 0
+        while True:
+            header, offset = read_varint(body, offset)
+            ticks, kind = header >> 2, header & 3
+            value = None
+            if kind in (MOVE, FIRE):
+                dx, offset = read_varint(body, offset)
+                dy, offset = read_varint(body, offset)
+                value = (unzigzag(dx), unzigzag(dy))
+            elif kind == LEVEL:
+                value = DIFFICULTIES[body[offset]]
+                offset += 1
+            self.records.append((ticks, kind, value))
+            if kind == END:
+                break
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "rb") as file:
+            return cls(file.read())
+
+    def new_game(self, **kwargs):
+        # A Game with the recorded seed and options; kwargs add the rest (size, sprite classes)
+        return Game(collision_backend=self.collision_backend, numpy_orb_engine=self.numpy_orb_engine,
+                    next_color_weighted=self.next_color_weighted, seed=self.seed, **kwargs)
+
+    def play(self, game=None, on_tick=None):
+        # Re-drive a session on a Game made by new_game(); on_tick(game, mouse_pos) runs after every tick
+        if game is None:
+            game = self.new_game()
+        mouse_x, mouse_y = 0, 0
+        angle = 0.0
+        results = []
+
+        def step(ticks):
+            for _ in range(ticks):
+                if game.state != "playing":
+                    # A level that is over is not stepped any more, as in the game loop
+                    return
+                game.step()
+                if on_tick is not None:
+                    on_tick(game, (mouse_x, mouse_y))
+
+        for ticks, kind, value in self.records:
+            step(ticks)
+            if kind in (MOVE, FIRE):
+                mouse_x += value[0]
+                mouse_y += value[1]
+                # Same aim as Launcher.update, from the launcher at the center
+                angle = math.atan2(mouse_y - game.center[1], mouse_x - game.center[0])
+            if kind == FIRE:
+                game.fire(angle)
+            elif kind in (LEVEL, END):
+                if game.state != "title":
+                    results.append((game.difficulty, game.state, game.score, game.ticks))
+                if kind == LEVEL:
+                    game.setup_level(value)
+        return results
+
+def main(argv=None):
+    # Only the command line needs these; the game imports this module for InputRecorder
+    import argparse
+    from skins import SKINS
+    parser = argparse.ArgumentParser(description="Play back an Orbital Match input replay.")
+    parser.add_argument("path")
+    parser.add_argument("--render", action="store_true", help="draw the replay in a window")
+    parser.add_argument("--fps", type=float, default=0, help="ticks per second when rendering; 0 runs flat out")
+    parser.add_argument("--skin", default="rounded", choices=list(SKINS),
+                        help="launcher and sprite skin to draw with when rendering")
+    args = parser.parse_args(argv)
+    replay = Replay.load(args.path)
+
+    game = None
+    on_tick = None
+    if args.render:
+        # Opens the game window, so only imported when rendering
+        import orbital_match as frontend
+        frontend.select_skin(args.skin)
+        game = replay.new_game(width=frontend.SCREEN_WIDTH, height=frontend.SCREEN_HEIGHT, orb_class=frontend.Orb,
+                               projectile_class=frontend.Projectile)
+        launcher = frontend.Launcher()
+        clock = pygame.time.Clock()
+
+        def on_tick(game, mouse_pos):
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    sys.exit()
+            launcher.angle = math.atan2(mouse_pos[1] - launcher.rect.centery, mouse_pos[0] - launcher.rect.centerx)
+            game.sync_rects()
+            frontend.screen.fill(frontend.BLACK)
+            launcher.draw(frontend.screen)
+            game.orbs.draw(frontend.screen)
+            game.projectiles.draw(frontend.screen)
+            frontend.draw_hud(frontend.screen, game.score, game.lives, game.combo_count, game.next_projectile_color)
+            pygame.display.flip()
+            clock.tick(args.fps)
+
+    start = time.perf_counter()
+    results = replay.play(game, on_tick)
+    seconds = time.perf_counter() - start
+    total_ticks = sum(result[3] for result in results)
+    print(f"seed {replay.seed}, {len(replay.records)} records")
+    for difficulty, state, score, ticks in results:
+        print(f"{difficulty:>8} {state:>10} score {score:>6} after {ticks} ticks")
+    print(f"{total_ticks} ticks in {seconds:.2f} s ({total_ticks / max(seconds, 1e-9):.0f} ticks/s, "
+          f"{total_ticks / 60 / max(seconds, 1e-9):.0f}x real time at 60 ticks/s)")
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,90 @@
+from collections import deque
+
+from snapshot import restore_snapshot, take_snapshot
+
+NO_SHOTS = ()
+
+class RewindBuffer:
+    """
+    Bounded history of recent game states for rewinding and scrubbing.
+
+    Every keyframe_interval ticks a full snapshot of the game is kept (a
+    keyframe). The ticks in between only keep their delta: the angles shot
+    just before them, which is all the input a tick takes. Since a Game is
+    deterministic, any held tick is rebuilt exactly by restoring the keyframe
+    before it and replaying the shots and steps from there, at most
+    keyframe_interval - 1 of them.
+
+    The frontend calls fire() for every shot and record() after every step.
+    Once more than capacity ticks are held, the oldest keyframe and its ticks
+    are dropped together.
+    """
+    def __init__(self, capacity=1800, keyframe_interval=60):
+        self.capacity = capacity
+        self.keyframe_interval = keyframe_interval
+        # Each held tick is its keyframe snapshot (bytes) or the tuple of angles shot before it
+        self.frames = deque()
+        self.pending_shots = []
+        self.since_keyframe = 0
+
+    def __len__(self):
+        return len(self.frames)
+
+    def clear(self):
+        self.frames.clear()
+        self.pending_shots = []
+        self.since_keyframe = 0
+
+    def fire(self, angle):
+        # A shot taken before the coming tick
+        self.pending_shots.append(angle)
+
+    def record(self, game):
+        # Called after every Game.step()
+        if not self.frames or self.since_keyframe >= self.keyframe_interval:
+            self.frames.append(take_snapshot(game))
+            self.since_keyframe = 0
+        else:
+            self.frames.append(tuple(self.pending_shots) if self.pending_shots else NO_SHOTS)
+        self.pending_shots = []
+        self.since_keyframe += 1
+        if len(self.frames) > self.capacity:
+            # Drop the oldest keyframe with the ticks that depend on it
+            self.frames.popleft()
+            while self.frames and not isinstance(self.frames[0], bytes):
+                self.frames.popleft()
+
+    def restore(self, game, index):
+        # Put game into the state after the index-th held tick, 0 being the oldest
+        keyframe_index = index
+        while not isinstance(self.frames[keyframe_index], bytes):
+            keyframe_index -= 1
+        restore_snapshot(game, self.frames[keyframe_index])
+        # The ticks replayed here are not frames being played, so they are kept out of the profile
+        profiler = game.profiler
+        game.profiler = None
+        try:
+            for position in range(keyframe_index + 1, index + 1):
+                for angle in self.frames[position]:
+                    game.fire(angle)
+                game.step()
+        finally:
+            game.profiler = profiler
+        return game
+
+    def truncate(self, length):
+        # Forget everything after the first length ticks, to play on from a rewound state
+        while len(self.frames) > length:
+            self.frames.pop()
+        self.pending_shots = []
+        # Count ticks from the last held keyframe again
+        self.since_keyframe = 0
+        for frame in reversed(self.frames):
+            if isinstance(frame, bytes):
+                break
+            self.since_keyframe += 1
+        self.since_keyframe += 1
+
+    def memory_bytes(self):
+        # Snapshot bytes plus 8 bytes per stored shot angle and per deque slot
+        return sum(len(frame) if isinstance(frame, bytes) else 8 * len(frame) + 8 for frame in self.frames)
@@ -0,0 +1,257 @@
+"""
+Orbital Match rules without a window.
+
+The orb and projectile model, scoring and combo rules and the difficulty
+presets live here so they can run in tests, bots and batch jobs. Only
+pygame.Rect and the sprite containers are used, which need no display,
+audio device or fonts; nothing in this module initializes SDL. The game
+scripts are frontends that draw a Game and feed it the player's input.
+"""
+import math
+import random
+import pygame
+from collision import GridCollider, RingCollider, SweptCollider
+from color_registry import ColorTrackingGroup
+from orb_engine import OrbEngine
+
+# --- Playing Field ---
+FIELD_WIDTH = 1000
+FIELD_HEIGHT = 700
+
+# --- Orb Colors ---
+GREEN = (34, 197, 94)
+RED = (248, 113, 113)
+BLUE = (59, 130, 246)
+YELLOW = (253, 224, 71)
+CYAN = (0, 255, 255)
+ORANGE = (255, 165, 0)
+COLORS = [GREEN, RED, BLUE, YELLOW, CYAN, ORANGE]
+
+# --- Rules ---
+LIVES_COUNT = 3
+PROJECTILE_SPEED = 15 # Pixels per tick; any speed keeps the aim exact
+ORB_SIZE = 30
+PROJECTILE_SIZE = 20
+HIT_SCORE = 100
+COMBO_STEP = 5 # Every 5 hits in a row add one to the score multiplier
+
+# --- Difficulty Presets ---
+DIFFICULTY_PRESETS = {
+    "easy": {"speed_modifier": 1.2, "orb_count": 15, "available_colors": 3}, # Earth
+    "medium": {"speed_modifier": 1.7, "orb_count": 25, "available_colors": 4}, # Mars
+    "hard": {"speed_modifier": 3.0, "orb_count": 40, "available_colors": 5}, # Neptune
+}
+
+def new_seed():
+    # A fresh session seed, independent of any seeding of the global random module
+    return random.SystemRandom().getrandbits(32)
+
+def score_multiplier(combo_count):
+    return 1 + (combo_count // COMBO_STEP)
+
+def ring_radius(index):
+    # Orbs are dealt round-robin onto three rings
+    return 200 + (index % 3) * 50
+
+class Orb(pygame.sprite.Sprite):
+    """
+    The colored orbs that orbit the center.
+    """
+    def __init__(self, color, radius, angle, speed, center):
+        super().__init__()
+        self.color = color
+        self.radius = radius
+        self.angle = angle
+        self.speed = speed
+        self.center_x, self.center_y = center
+        self.rect = pygame.Rect(0, 0, ORB_SIZE, ORB_SIZE)
+        # Exact position as floats; the rect is only its rounded copy
+        self.x, self.y = self.rect.center
+
+    def update(self, speed_modifier):
+        self.angle += self.speed * speed_modifier
+        self.x = self.center_x + self.radius * math.cos(self.angle)
+        self.y = self.center_y + self.radius * math.sin(self.angle)
+        self.rect.center = (self.x, self.y)
+
+class Projectile(pygame.sprite.Sprite):
+    """
+    Projectiles fired from the launcher.
+    """
+    def __init__(self, x, y, color, angle, speed=PROJECTILE_SPEED):
+        super().__init__()
+        self.color = color
+        self.rect = pygame.Rect(0, 0, PROJECTILE_SIZE, PROJECTILE_SIZE)
+        self.rect.center = (x, y)
+        self.speed = speed
+        # Position and velocity are kept as floats so shots fly exactly along
+        # the aimed angle at any speed; the rect is only synced from them
+        self.x = x
+        self.y = y
+        self.velocity_x = self.speed * math.cos(angle)
+        self.velocity_y = self.speed * math.sin(angle)
+
+    def update(self):
+        self.x += self.velocity_x
+        self.y += self.velocity_y
+        self.rect.center = (self.x, self.y)
+
+class Game:
+    """
+    One session of Orbital Match, advanced one fixed tick at a time.
+
+    state is "playing", "win" or "game_over". A frontend calls setup_level()
+    with a difficulty, fire() when the player clicks and step() once per tick.
+    orb_class and projectile_class let a frontend create sprites that also
+    carry an image.
+
+    All randomness (orb colors, speed jitter, next colors) comes from one
+    random.Random seeded with seed, so a session with the same seed and the
+    same input plays out the same way. The seed used is kept in self.seed.
+    """
+    def __init__(self, width=FIELD_WIDTH, height=FIELD_HEIGHT, orb_class=Orb, projectile_class=Projectile,
+                 collision_backend="rects", numpy_orb_engine=False, next_color_weighted=False,
+                 lives_count=LIVES_COUNT, projectile_speed=PROJECTILE_SPEED, seed=None):
+        if numpy_orb_engine and collision_backend in ("rings", "swept"):
+            # Both follow Orb.angle, which the engine does not update
+            raise ValueError(f"the {collision_backend!r} collision backend does not work with the NumPy orb engine")
+        self.width = width
+        self.height = height
+        self.center = (width // 2, height // 2)
+        self.orb_class = orb_class
+        self.projectile_class = projectile_class
+        self.collision_backend = collision_backend
+        self.numpy_orb_engine = numpy_orb_engine
+        self.next_color_weighted = next_color_weighted
+        self.lives_count = lives_count
+        self.projectile_speed = projectile_speed
+        self.seed = new_seed() if seed is None else seed
+        self.rng = random.Random(self.seed)
+        self.state = "title"
+        self.orbs = ColorTrackingGroup()
+        self.projectiles = pygame.sprite.Group()
+        # A profiler.FrameProfiler to charge the phases of step() to; None when not profiling
+        self.profiler = None
+
+    def setup_level(self, difficulty, rng=None):
+        # The orb layout draws from rng when one is given; next colors always come from the session RNG
+        layout_rng = self.rng if rng is None else rng
+        preset = DIFFICULTY_PRESETS[difficulty]
+        self.difficulty = difficulty
+        self.speed_modifier = preset["speed_modifier"]
+        self.orb_count = preset["orb_count"]
+        self.available_colors = preset["available_colors"]
+
+        # Keeps a live count of each orb color for picking the next projectile
+        self.orbs = ColorTrackingGroup()
+        self.projectiles = pygame.sprite.Group()
+        for i in range(self.orb_count):
+            color = layout_rng.choice(COLORS[:self.available_colors])
+            radius = ring_radius(i)
+            angle = (i / self.orb_count) * 2 * math.pi
+            speed = 0.005 + layout_rng.uniform(-0.001, 0.001)
+            self.orbs.add(self.orb_class(color, radius, angle, speed, self.center))
+        self.setup_backends()
+
+        self.state = "playing"
+        self.score = 0
+        self.lives = self.lives_count
+        self.combo_count = 0
+        self.ticks = 0
+        if self.orbs:
+            # The first color is weighted by how many orbs of each color there are
+            self.next_projectile_color = self.orbs.colors.random_color(weighted=True, rng=self.rng)
+        else:
+            self.next_projectile_color = self.rng.choice(COLORS[:self.available_colors])
+
+    def setup_backends(self):
+        # Orb engine and collider for the current orbs; call again after replacing them
+        if self.numpy_orb_engine:
+            self.orb_engine = OrbEngine(self.orbs, self.center, COLORS)
+        else:
+            self.orb_engine = None
+
+        if self.collision_backend == "rects" and self.orb_engine is not None:
+            # The engine tests the orb rects from its arrays, without writing them back every tick
+            self.collider = self.orb_engine
+        elif self.collision_backend == "rings":
+            self.collider = RingCollider(self.center, self.speed_modifier)
+        elif self.collision_backend == "grid":
+            # Cells as big as the largest sprite (30 px orbs)
+            self.collider = GridCollider(cell_size=ORB_SIZE)
+        elif self.collision_backend == "swept":
+            self.collider = SweptCollider(self.center, self.speed_modifier)
+        else:
+            self.collider = None
+
+    def fire(self, angle):
+        # Launch the next projectile from the center; returns it, or None if nothing is left to hit
+        if not self.orbs:
+            return None
+        projectile = self.projectile_class(self.center[0], self.center[1], self.next_projectile_color,
+                                           angle, self.projectile_speed)
+        self.projectiles.add(projectile)
+        self.next_projectile_color = self.orbs.colors.random_color(self.next_color_weighted, self.rng)
+        return projectile
+
+    def miss(self):
+        self.lives -= 1
+        self.combo_count = 0
+
+    def hit(self):
+        self.combo_count += 1
+        self.score += HIT_SCORE * score_multiplier(self.combo_count)
+
+    def sync_rects(self):
+        # Bring the orb rects up to date before drawing; the NumPy engine only writes them back when asked
+        if self.orb_engine is not None:
+            self.orb_engine.write_back()
+
+    def step(self):
+        # --- Movement ---
+        if self.orb_engine is not None:
+            # The engine moves every orb at once
+            self.orb_engine.update(self.orbs, self.speed_modifier)
+            if self.collider is not self.orb_engine:
+                # The other colliders read the orb rects
+                self.orb_engine.write_back()
+        else:
+            self.orbs.update(self.speed_modifier)
+        self.projectiles.update()
+        self.ticks += 1
+        profiler = self.profiler
+        if profiler is not None:
+            profiler.mark("movement")
+
+        # --- Projectiles that left the field ---
+        for projectile in self.projectiles.copy():
+            rect = projectile.rect
+            if rect.left > self.width or rect.right < 0 or rect.top > self.height or rect.bottom < 0:
+                self.miss()
+                projectile.kill()
+        if profiler is not None:
+            profiler.mark("cull")
+
+        # --- Collisions ---
+        if self.collider is not None:
+            collided_dict = self.collider.groupcollide(self.projectiles, self.orbs, False, False)
+        else:
+            collided_dict = pygame.sprite.groupcollide(self.projectiles, self.orbs, False, False)
+        for projectile, collided_orbs in collided_dict.items():
+            for orb in collided_orbs:
+                if projectile.color == orb.color:
+                    self.hit()
+                    projectile.kill()
+                    orb.kill()
+                    self.next_projectile_color = self.orbs.colors.random_color(self.next_color_weighted, self.rng)
+                else:
+                    self.miss()
+                    projectile.kill()
+
+        # --- Win / Game Over ---
+        if not self.orbs:
+            self.state = "win"
+        if self.lives <= 0:
+            self.state = "game_over"
+        if profiler is not None:
+            profiler.mark("collisions")
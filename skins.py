@@ -0,0 +1,171 @@
+import pygame
+
+# --- Colors ---
+WHITE = (255, 255, 255)
+LIGHT_GRAY = (150, 150, 150)
+
+# --- Orb and Projectile Art ---
+def create_orb_3d_surface(color):
+    surface = pygame.Surface([30, 30], pygame.SRCALPHA)
+    base_color = color
+    light_color = [min(255, c + 70) for c in color]
+    dark_color = [max(0, c - 70) for c in color]
+    
+    # Radial gradient from dark to light
+    for i in range(15):
+        alpha = int(255 * (i / 15))
+        gradient_color = [dark_color[j] + int((base_color[j] - dark_color[j]) * (i / 15)) for j in range(3)]
+        pygame.draw.circle(surface, gradient_color, (15, 15), 15-i)
+
+    # Highlight from a light source
+    light_pos = (10, 10)
+    pygame.draw.circle(surface, light_color, light_pos, 7)
+    
+    # Specular highlight
+    pygame.draw.circle(surface, WHITE, (7, 7), 3)
+    
+    return surface
+
+def create_projectile_3d_surface(color):
+    surface = pygame.Surface([20, 20], pygame.SRCALPHA)
+    base_color = color
+    light_color = [min(255, c + 100) for c in color]
+    
+    # Radial gradient
+    for i in range(10):
+        gradient_color = [base_color[j] + int((light_color[j] - base_color[j]) * (i / 10)) for j in range(3)]
+        pygame.draw.circle(surface, gradient_color, (10, 10), 10-i)
+    
+    # Specular highlight
+    pygame.draw.circle(surface, WHITE, (7, 7), 3)
+
+    return surface
+
+def create_orb_flat_surface(color):
+    surface = pygame.Surface([30, 30], pygame.SRCALPHA)
+    pygame.draw.circle(surface, color, (15, 15), 15)
+    return surface
+
+def create_projectile_flat_surface(color):
+    surface = pygame.Surface([20, 20], pygame.SRCALPHA)
+    pygame.draw.circle(surface, color, (10, 10), 10)
+    return surface
+
+# --- Cannon Art ---
+# Each cannon points right, along the launcher's zero angle
+def create_rounded_cannon():
+    # Draw the cannon on its own surface, so it can be rotated as one unit
+    cannon_surface = pygame.Surface((150, 60), pygame.SRCALPHA)
+    cannon_surface.fill((0, 0, 0, 0)) # Fill with transparent color
+    
+    # Draw the main cannon body as a rounded rectangle
+    body_rect = pygame.Rect(0, 5, 100, 50)
+    pygame.draw.rect(cannon_surface, (70, 70, 100), body_rect, border_radius=15)
+    
+    # Draw the cannon barrel
+    barrel_rect = pygame.Rect(90, 15, 60, 30)
+    pygame.draw.rect(cannon_surface, (100, 100, 150), barrel_rect, border_radius=5)
+    
+    # Draw the glowing central core
+    core_pos = (50, 30)
+    core_radius = 15
+    # Outer glow
+    for i in range(3):
+        alpha = int(255 * (i/3))
+        glow_color = (150, 150, 200, alpha)
+        pygame.draw.circle(cannon_surface, glow_color, core_pos, core_radius + i, 1)
+    # Inner core
+    pygame.draw.circle(cannon_surface, (200, 200, 255), core_pos, core_radius)
+
+    return cannon_surface
+
+def create_trimmed_cannon():
+    # Draw the cannon on its own surface, so it can be rotated as one unit
+    # (5 px wider on each side than the art, so the chamber dot at the muzzle fits)
+    cannon_surface = pygame.Surface((160, 80), pygame.SRCALPHA)
+    cannon_surface.fill((0, 0, 0, 0)) # Fill with transparent color
+    
+    # Draw the main cannon body as a rounded rectangle
+    body_rect = pygame.Rect(5, 15, 120, 50)
+    pygame.draw.rect(cannon_surface, (70, 70, 100), body_rect, border_radius=15)
+    
+    # Draw the cannon barrel
+    barrel_rect = pygame.Rect(105, 25, 50, 30)
+    pygame.draw.rect(cannon_surface, (100, 100, 150), barrel_rect, border_radius=5)
+    
+    # Draw some decorative trim on the body
+    trim_rect = pygame.Rect(20, 30, 90, 20)
+    pygame.draw.rect(cannon_surface, (120, 120, 180), trim_rect, border_radius=5)
+
+    # Draw a circle on the cannon's face where the ball appears, 70 px ahead of the center it turns about
+    pygame.draw.circle(cannon_surface, LIGHT_GRAY, (80 + 70, 40), 10)
+
+    return cannon_surface
+
+def create_faceted_cannon():
+    # Draw the cannon on its own surface, so it can be rotated as one unit
+    cannon_surface = pygame.Surface((200, 100), pygame.SRCALPHA)
+    cannon_surface.fill((0, 0, 0, 0)) # Fill with transparent color
+    
+    # Draw the main cannon body as a series of polygons for a faceted look
+    body_color_main = (70, 70, 100)
+    body_color_light = (100, 100, 150)
+    
+    # Main body polygon
+    main_body_points = [
+        (20, 20), (150, 15), (150, 65), (20, 60)
+    ]
+    pygame.draw.polygon(cannon_surface, body_color_main, main_body_points)
+    
+    # Light side of the body
+    light_side_points = [
+        (20, 20), (150, 15), (150, 25), (20, 30)
+    ]
+    pygame.draw.polygon(cannon_surface, body_color_light, light_side_points)
+    
+    # Draw the cannon barrel
+    barrel_rect = pygame.Rect(150, 25, 40, 30)
+    pygame.draw.rect(cannon_surface, (100, 100, 150), barrel_rect, border_radius=5)
+    
+    # Draw the glowing central core
+    core_pos = (50, 40)
+    core_radius = 20
+    # Outer glow
+    for i in range(5):
+        alpha = int(255 * (i/5))
+        glow_color = (255, 255, 255, alpha)
+        pygame.draw.circle(cannon_surface, glow_color, core_pos, core_radius + i, 1)
+    # Inner core
+    pygame.draw.circle(cannon_surface, WHITE, core_pos, core_radius)
+
+    return cannon_surface
+
+class Skin:
+    """
+    How the launcher and the sprites look.
+
+    cannon draws the cannon art once, pointing right; the launcher rotates it
+    into a RotationCache. Without one the launcher draws a plain aim line.
+    hub_radius puts a white disc over the launcher center when set.
+    """
+    def __init__(self, name, label, cannon=None, hub_radius=0,
+                 orb=create_orb_3d_surface, projectile=create_projectile_3d_surface):
+        self.name = name
+        self.label = label
+        self.cannon = cannon
+        self.hub_radius = hub_radius
+        self.orb = orb
+        self.projectile = projectile
+
+# Skins by name; the SKIN option and the settings screen pick one of these
+SKINS = {}
+
+def register_skin(skin):
+    SKINS[skin.name] = skin
+    return skin
+
+register_skin(Skin("rounded", "Rounded", create_rounded_cannon))
+register_skin(Skin("trimmed", "Trimmed", create_trimmed_cannon))
+register_skin(Skin("faceted", "Faceted", create_faceted_cannon))
+register_skin(Skin("line", "Aim Line", hub_radius=25, orb=create_orb_flat_surface,
+                   projectile=create_projectile_flat_surface))
@@ -0,0 +1,149 @@
+"""
+Versioned binary snapshots of a running simulation.Game.
+
+A snapshot holds everything the next tick depends on: the level settings,
+state, score, lives, combo, next projectile color, the session RNG, the order
+the color registry picks colors from, and every orb and projectile in group
+order. Per-sprite fields are packed as little-endian arrays, one array per
+field, so taking a snapshot is a few
+bulk copies rather than per-object serialization; with the NumPy orb engine
+the orb arrays are copied straight from the engine. restore_snapshot() puts
+a Game back exactly as it was, down to the colors it will pick next.
+"""
+import struct
+import sys
+from array import array
+
+from simulation import COLORS, DIFFICULTY_PRESETS
+
+MAGIC = b"OMSS"
+VERSION = 2
+HEADER = struct.Struct("<4sB") # magic, version
+STATE = struct.Struct("<BBBbIdqiiqIIBdB")
+STATES = ["title", "playing", "win", "game_over"]
+DIFFICULTIES = list(DIFFICULTY_PRESETS)
+COLOR_INDEX = {color: index for index, color in enumerate(COLORS)}
+RNG_WORDS = 625 # Length of the Mersenne Twister state tuple
+
+# Per-sprite fields in the order they are stored, with their array type codes
+ORB_FIELDS = [("color", "b"), ("radius", "d"), ("angle", "d"), ("speed", "d"), ("x", "d"), ("y", "d")]
+PROJECTILE_FIELDS = [("color", "b"), ("x", "d"), ("y", "d"), ("velocity_x", "d"), ("velocity_y", "d"), ("speed", "d")]
+
+def _pack(type_code, values):
+    packed = array(type_code, values)
+    if sys.byteorder == "big":
+        packed.byteswap()
+    return packed.tobytes()
+
+def _unpack(type_code, data, offset, count):
+    values = array(type_code)
+    end = offset + count * values.itemsize
+    values.frombytes(data[offset:end])
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values, end
+
+def _pack_sprites(sprites, fields):
+    chunks = []
+    for name, type_code in fields:
+        if name == "color":
+            chunks.append(bytes([COLOR_INDEX[sprite.color] for sprite in sprites]))
+        else:
+            chunks.append(_pack(type_code, [getattr(sprite, name) for sprite in sprites]))
+    return b"".join(chunks)
+
+def _pack_engine(engine):
+    # Same layout as _pack_sprites(orbs, ORB_FIELDS), straight from the engine's arrays
+    x, y = engine.positions()
+    columns = [engine.radius, engine.angle, engine.speed, x, y]
+    return engine.color_index.tobytes() + b"".join(column.astype("<f8").tobytes() for column in columns)
+
+def _unpack_sprites(data, offset, count, fields):
+    columns = {}
+    for name, type_code in fields:
+        columns[name], offset = _unpack(type_code, data, offset, count)
+    return columns, offset
+
+def take_snapshot(game):
+    # The game's state as bytes; fast enough to call every tick
+    if game.state == "title":
+        raise ValueError("there is no level to snapshot before setup_level()")
+    engine = game.orb_engine
+    if engine is None:
+        orbs = game.orbs.sprites()
+        orb_count = len(orbs)
+        orb_data = _pack_sprites(orbs, ORB_FIELDS)
+    else:
+        # The engine holds the orb angles and positions, in group order
+        if len(engine) != len(game.orbs):
+            engine.remove_dead()
+        orb_count = len(engine)
+        orb_data = _pack_engine(engine)
+    projectiles = game.projectiles.sprites()
+    _, rng_words, gauss_next = game.rng.getstate()
+    present = game.orbs.colors.present
+    next_color = -1 if game.next_projectile_color is None else COLOR_INDEX[game.next_projectile_color]
+    return b"".join([
+        HEADER.pack(MAGIC, VERSION),
+        STATE.pack(DIFFICULTIES.index(game.difficulty), STATES.index(game.state), game.available_colors,
+                   next_color, game.orb_count, game.speed_modifier, game.score, game.lives, game.combo_count,
+                   game.ticks, orb_count, len(projectiles), gauss_next is not None, gauss_next or 0.0,
+                   len(present)),
+        _pack("I", rng_words),
+        bytes([COLOR_INDEX[color] for color in present]),
+        orb_data,
+        _pack_sprites(projectiles, PROJECTILE_FIELDS),
+    ])
+
+def restore_snapshot(game, data):
+    # Put game back into the state a snapshot was taken in, using its own orb and projectile classes
+    magic, version = HEADER.unpack_from(data)
+    if magic != MAGIC:
+        raise ValueError("not an Orbital Match snapshot")
+    if version != VERSION:
+        raise ValueError(f"unsupported snapshot version {version}")
+    (difficulty, state, available_colors, next_color, orb_count, speed_modifier, score, lives, combo_count,
+     ticks, orb_total, projectile_total, has_gauss, gauss_next, present_total) = STATE.unpack_from(data, HEADER.size)
+    offset = HEADER.size + STATE.size
+    rng_words, offset = _unpack("I", data, offset, RNG_WORDS)
+    present = [COLORS[index] for index in data[offset:offset + present_total]]
+    offset += present_total
+    orb_columns, offset = _unpack_sprites(data, offset, orb_total, ORB_FIELDS)
+    projectile_columns, offset = _unpack_sprites(data, offset, projectile_total, PROJECTILE_FIELDS)
+
+    game.difficulty = DIFFICULTIES[difficulty]
+    game.speed_modifier = speed_modifier
+    game.orb_count = orb_count
+    game.available_colors = available_colors
+    game.state = STATES[state]
+    game.score = score
+    game.lives = lives
+    game.combo_count = combo_count
+    game.ticks = ticks
+    game.next_projectile_color = None if next_color < 0 else COLORS[next_color]
+    game.rng.setstate((3, tuple(rng_words), gauss_next if has_gauss else None))
+
+    orbs = []
+    for color, radius, angle, speed, x, y in zip(*orb_columns.values()):
+        orb = game.orb_class(COLORS[color], radius, angle, speed, game.center)
+        orb.x = x
+        orb.y = y
+        orb.rect.center = (x, y)
+        orbs.append(orb)
+    # The groups are refilled in place, so anything holding on to them stays valid
+    game.orbs.empty()
+    game.orbs.add(orbs)
+    game.orbs.colors.set_order(present)
+
+    projectiles = []
+    for color, x, y, velocity_x, velocity_y, speed in zip(*projectile_columns.values()):
+        projectile = game.projectile_class(x, y, COLORS[color], 0.0, speed)
+        projectile.velocity_x = velocity_x
+        projectile.velocity_y = velocity_y
+        projectiles.append(projectile)
+    game.projectiles.empty()
+    game.projectiles.add(projectiles)
+
+    # Backends keep per-sprite state, so they start over with the restored sprites
+    game.setup_backends()
+    return game
@@ -0,0 +1,145 @@
+import math
+import warnings
+import pygame
+
+# --- Cache Limits ---
+ROTATION_CACHE_MAX_BYTES = 64 * 1024 * 1024 # 64 MB for all rotated frames of one sprite; pass max_bytes to change it
+
+class RotationCache:
+    """
+    Pre-rotated frames of a sprite, looked up by the nearest angle.
+
+    The art is rotated once per angular step instead of once per frame. Each
+    frame is cropped to its visible pixels, so place() returns the rect to
+    blit it at. If the frames at the requested step would not fit into
+    max_bytes, the step is widened until they do and a warning says so, so
+    memory use never grows past the limit.
+    With lazy=True frames are only rotated the first time they are asked for.
+    """
+    def __init__(self, image, step=1.0, lazy=False, max_bytes=ROTATION_CACHE_MAX_BYTES):
+        self.image = image
+        self.requested_step = step
+        self.lazy = lazy
+        self.max_bytes = max_bytes
+        # Rotating the visible part bounds every cropped frame
+        self.content_size = image.get_bounding_rect().size
+
+        # Widen the step until the worst case (every frame filled) fits the budget
+        frame_count = max(1, int(round(360 / step)))
+        average_bytes = self.estimate_bytes(frame_count) / frame_count
+        frame_count = max(1, min(frame_count, int(max_bytes // average_bytes)))
+        while frame_count > 1 and self.estimate_bytes(frame_count) > max_bytes:
+            frame_count -= 1
+        self.frame_count = frame_count
+        self.step = 360 / frame_count
+        if frame_count < int(round(360 / step)):
+            warnings.warn(f"rotated frames at {step:g} deg do not fit into {max_bytes / 1024:.0f} KB; "
+                          f"using {self.step:.2f} deg (raise max_bytes to keep the step)", stacklevel=2)
+        self.frames = [None] * frame_count
+        # Top-left corner of each cropped frame, relative to the center it is drawn around
+        self.offsets = [None] * frame_count
+
+        if not lazy:
+            for index in range(frame_count):
+                self._rotate(index)
+
+    def estimate_bytes(self, frame_count):
+        # Size of the rotated box around the visible pixels at every step, 4 bytes per pixel
+        width, height = self.content_size
+        total = 0
+        for index in range(frame_count):
+            angle = math.radians(index * 360 / frame_count)
+            cos_a = abs(math.cos(angle))
+            sin_a = abs(math.sin(angle))
+            rotated_w = math.ceil(width * cos_a + height * sin_a) + 1
+            rotated_h = math.ceil(width * sin_a + height * cos_a) + 1
+            total += rotated_w * rotated_h * 4
+        return total
+
+    def _rotate(self, index):
+        rotated = pygame.transform.rotate(self.image, index * self.step)
+        # Keep only the visible pixels; the padding of the rotated box is empty
+        visible = rotated.get_bounding_rect()
+        frame = rotated.subsurface(visible).copy()
+        # Match the display's pixel format so blitting the frame is fast
+        if pygame.display.get_surface() is not None:
+            frame = frame.convert_alpha()
+        self.frames[index] = frame
+        self.offsets[index] = (visible.x - rotated.get_width() // 2, visible.y - rotated.get_height() // 2)
+        return frame
+
+    def _index(self, angle_deg):
+        index = int(round(angle_deg / self.step)) % self.frame_count
+        if self.frames[index] is None:
+            self._rotate(index)
+        return index
+
+    def get(self, angle_deg):
+        # Nearest pre-rotated frame for an angle in degrees (pygame convention)
+        return self.frames[self._index(angle_deg)]
+
+    def place(self, angle_deg, center):
+        # Nearest frame and the rect that puts the art's center on center
+        index = self._index(angle_deg)
+        frame = self.frames[index]
+        offset_x, offset_y = self.offsets[index]
+        return frame, frame.get_rect(topleft=(center[0] + offset_x, center[1] + offset_y))
+
+    def filled_count(self):
+        return sum(1 for frame in self.frames if frame is not None)
+
+    def memory_bytes(self):
+        total = 0
+        for frame in self.frames:
+            if frame is not None:
+                total += frame.get_width() * frame.get_height() * frame.get_bytesize()
+        return total
+
+    def report(self):
+        return (f"{self.filled_count()}/{self.frame_count} frames at {self.step:.2f} deg "
+                f"(requested {self.requested_step:.2f}), "
+                f"{self.memory_bytes() / 1024:.0f} KB of {self.max_bytes / 1024:.0f} KB")
+
+class SpriteAtlas:
+    """
+    Shared sprite surfaces keyed by (kind, color, size).
+
+    Each kind is registered with a builder that draws one surface for a color.
+    A surface is built the first time it is asked for (or ahead of time with
+    prebuild) and the same converted surface is then handed to every sprite,
+    so creating a sprite only costs a dictionary lookup.
+    """
+    def __init__(self):
+        self.builders = {}
+        self.surfaces = {}
+
+    def register(self, kind, builder, size):
+        # size is the (width, height) the builder draws at; surfaces built by an earlier builder are dropped
+        self.builders[kind] = (builder, tuple(size))
+        self.surfaces = {key: surface for key, surface in self.surfaces.items() if key[0] != kind}
+
+    def get(self, kind, color, size=None):
+        key = (kind, color, size)
+        surface = self.surfaces.get(key)
+        if surface is None:
+            surface = self._build(kind, color, size)
+        return surface
+
+    def prebuild(self, kind, colors, size=None):
+        for color in colors:
+            self.get(kind, color, size)
+
+    def _build(self, kind, color, size):
+        builder, native_size = self.builders[kind]
+        surface = builder(color)
+        if size is not None and tuple(size) != native_size:
+            surface = pygame.transform.smoothscale(surface, size)
+        # Match the display's pixel format so blitting the sprite is fast
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert_alpha()
+        self.surfaces[(kind, color, size)] = surface
+        return surface
+
+    def memory_bytes(self):
+        return sum(surface.get_width() * surface.get_height() * surface.get_bytesize()
+                   for surface in self.surfaces.values())
@@ -0,0 +1,42 @@
+"""
+Timing of a cold start, from launch to the first title frame.
+
+A game script imports this module before anything else, pygame included, so
+STARTED is taken as close to launch as a script can get. The script then
+marks each startup step on timer as it finishes, and report() breaks the time
+to the first frame down by step.
+"""
+import time
+
+STARTED = time.perf_counter()
+
+class StartupTimer:
+    """
+    Named startup steps, each timed from the end of the step before it.
+    """
+    def __init__(self, started=STARTED):
+        self.started = started
+        self.last = started
+        self.steps = []
+        self.finished = False
+
+    def mark(self, step):
+        now = time.perf_counter()
+        self.steps.append((step, now - self.last))
+        self.last = now
+
+    def finish(self, step):
+        # Marks the last step; True only the first time, so later frames are not counted
+        if self.finished:
+            return False
+        self.mark(step)
+        self.finished = True
+        return True
+
+    def report(self):
+        lines = [f"Startup: {(self.last - self.started) * 1000:.0f} ms to the first frame"]
+        for step, seconds in self.steps:
+            lines.append(f"  {step:<20} {seconds * 1000:7.1f} ms")
+        return "\n".join(lines)
+
+timer = StartupTimer()
@@ -0,0 +1,58 @@
+from contextlib import contextmanager
+
+class FixedTimestep:
+    """
+    Fixed-rate game logic decoupled from the render rate.
+
+    Real frame time is added to an accumulator and the logic runs one tick per
+    whole tick_seconds in it, so the game plays at the same speed however fast
+    or slow frames are drawn. Rendering can then place sprites between the
+    last two ticks with interpolated() to hide the leftover time.
+    """
+    def __init__(self, tick_rate=60, max_ticks_per_frame=5):
+        self.tick_seconds = 1 / tick_rate
+        # After a long stall, drop the backlog instead of trying to catch up forever
+        self.max_frame_seconds = max_ticks_per_frame * self.tick_seconds
+        self.accumulator = 0.0
+        self.previous_centers = {}
+
+    def reset(self):
+        self.accumulator = 0.0
+        self.previous_centers = {}
+
+    def advance(self, frame_seconds):
+        # Number of logic ticks to run for a frame that took frame_seconds
+        self.accumulator += min(frame_seconds, self.max_frame_seconds)
+        ticks = int(self.accumulator / self.tick_seconds)
+        self.accumulator -= ticks * self.tick_seconds
+        return ticks
+
+    @property
+    def alpha(self):
+        # How far the render time is between the last tick and the next one
+        return self.accumulator / self.tick_seconds
+
+    def capture(self, sprites):
+        # Remember where every sprite was before the coming tick
+        self.previous_centers = {sprite: sprite.rect.center for sprite in sprites}
+
+    @contextmanager
+    def interpolated(self, sprites):
+        # Temporarily move sprites to where they are between the last two ticks
+        alpha = self.alpha
+        restore = []
+        for sprite in sprites:
+            previous = self.previous_centers.get(sprite)
+            if previous is None:
+                continue
+            rect = sprite.rect
+            current = rect.center
+            if previous != current:
+                restore.append((rect, current))
+                rect.center = (previous[0] + (current[0] - previous[0]) * alpha,
+                               previous[1] + (current[1] - previous[1]) * alpha)
+        try:
+            yield
+        finally:
+            for rect, center in restore:
+                rect.center = center
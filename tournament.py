@@ -0,0 +1,140 @@
+"""
+Play many headless games of Orbital Match with automated players.
+
+Games are spread over a process pool (all cores by default) and use the
+simulation.Game rules, so lives, the combo multiplier and the win/game-over
+transitions are the ones the game scripts play by. Every game's session seed
+is derived from --seed and its index and written with its result, which
+makes each game reproducible on its own whatever the worker count. One CSV line per game streams to --out as
+results arrive, in game order.
+
+    python tournament.py --games 1000 --difficulty easy medium hard --policy lead --out results.csv
+
+A policy is a function policy(game, rng) called once per tick; it returns the
+angle to fire at, or None to hold fire. Besides the built-in ones, --policy
+accepts "module:function" for a policy defined elsewhere.
+"""
+import argparse
+import csv
+import importlib
+import math
+import os
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from simulation import DIFFICULTY_PRESETS, Game
+
+MAX_TICKS = 60 * 60 * 10 # Ten minutes of game time per game at most
+RESULT_FIELDS = ["game", "seed", "difficulty", "policy", "state", "score", "lives", "orbs_left", "shots", "ticks"]
+
+# --- Policies ---
+def random_policy(game, rng):
+    # Fires at a random angle whenever nothing is in flight
+    if not game.projectiles:
+        return rng.uniform(-math.pi, math.pi)
+    return None
+
+def nearest_policy(game, rng):
+    # Fires straight at where an orb of the next color is now
+    if game.projectiles:
+        return None
+    targets = [orb for orb in game.orbs if orb.color == game.next_projectile_color]
+    if not targets:
+        return None
+    orb = targets[0]
+    return math.atan2(orb.y - game.center[1], orb.x - game.center[0])
+
+def lead_policy(game, rng):
+    # Fires where an orb of the next color will be when the shot reaches its ring
+    if game.projectiles:
+        return None
+    targets = [orb for orb in game.orbs if orb.color == game.next_projectile_color]
+    if not targets:
+        return None
+    orb = targets[0]
+    flight_ticks = orb.radius / game.projectile_speed
+    return orb.angle + orb.speed * game.speed_modifier * flight_ticks
+
+POLICIES = {
+    "random": random_policy,
+    "nearest": nearest_policy,
+    "lead": lead_policy,
+}
+
+def load_policy(name):
+    if name in POLICIES:
+        return POLICIES[name]
+    module_name, _, function_name = name.partition(":")
+    if not function_name:
+        raise ValueError(f"unknown policy {name!r}; use one of {', '.join(POLICIES)} or module:function")
+    return getattr(importlib.import_module(module_name), function_name)
+
+def game_seed(base_seed, index):
+    # Seeds are spread out so neighboring games do not share RNG streams
+    return (base_seed * 1000003 + index) & 0xFFFFFFFF
+
+def play_game(job):
+    index, seed, difficulty, policy_name, max_ticks = job
+    policy = load_policy(policy_name)
+    game = Game(seed=seed)
+    game.setup_level(difficulty)
+    # The policy draws from its own stream so it cannot shift the level's colors
+    rng = random.Random(f"{seed}/policy")
+    shots = 0
+    while game.state == "playing" and game.ticks < max_ticks:
+        angle = policy(game, rng)
+        if angle is not None and game.fire(angle) is not None:
+            shots += 1
+        game.step()
+    return [index, seed, difficulty, policy_name, game.state, game.score, game.lives, len(game.orbs), shots, game.ticks]
+
+def make_jobs(args):
+    index = 0
+    for difficulty in args.difficulty:
+        for policy_name in args.policy:
+            for _ in range(args.games):
+                yield (index, game_seed(args.seed, index), difficulty, policy_name, args.max_ticks)
+                index += 1
+
+def print_summary(results, seconds):
+    groups = {}
+    for row in results:
+        groups.setdefault((row[2], row[3]), []).append(row)
+    print(f"{'difficulty':>10} {'policy':>10} {'games':>6} {'won':>5} {'avg score':>10} {'avg ticks':>10}")
+    for (difficulty, policy_name), rows in groups.items():
+        won = sum(row[4] == "win" for row in rows)
+        score = sum(row[5] for row in rows) / len(rows)
+        ticks = sum(row[9] for row in rows) / len(rows)
+        print(f"{difficulty:>10} {policy_name:>10} {len(rows):>6} {won / len(rows):>5.0%} {score:>10.0f} {ticks:>10.0f}")
+    print(f"{len(results)} games in {seconds:.1f} s ({len(results) / seconds:.0f} games/s)")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Play many headless Orbital Match games with automated players.")
+    parser.add_argument("--games", type=int, default=100, help="games per difficulty and policy")
+    parser.add_argument("--difficulty", nargs="+", default=["easy"], choices=list(DIFFICULTY_PRESETS))
+    parser.add_argument("--policy", nargs="+", default=["lead"], help=f"{', '.join(POLICIES)} or module:function")
+    parser.add_argument("--seed", type=int, default=0, help="base seed; game i uses a seed derived from it and i")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="worker processes (default: all cores)")
+    parser.add_argument("--max-ticks", type=int, default=MAX_TICKS, help="stop a game that runs longer than this")
+    parser.add_argument("--out", default="tournament_results.csv", help="CSV file for per-game results")
+    args = parser.parse_args(argv)
+    for policy_name in args.policy:
+        load_policy(policy_name) # Fail before starting the pool
+
+    start = time.perf_counter()
+    results = []
+    with open(args.out, "w", newline="") as out, ProcessPoolExecutor(args.workers) as pool:
+        writer = csv.writer(out)
+        writer.writerow(RESULT_FIELDS)
+        # Chunks keep the pool busy without paying a round trip per game
+        chunk_size = max(1, args.games // (4 * args.workers))
+        for row in pool.map(play_game, make_jobs(args), chunksize=chunk_size):
+            writer.writerow(row)
+            results.append(row)
+    print_summary(results, time.perf_counter() - start)
+    print(f"results written to {args.out}")
+
+if __name__ == "__main__":
+    sys.exit(main())